@@ -28,6 +28,17 @@ from tri_sarira_rpg.systems.world import WorldSystem
 
 logger = logging.getLogger(__name__)
 
+# Event types die de game/scenes verwerken; al het andere komt niet in de queue.
+# Input is keyboard-only. Voeg hier een type toe als een scene er iets mee doet.
+_HANDLED_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,  # held movement keys (overworld)
+    pygame.VIDEOEXPOSE,  # main menu frame cache
+    pygame.WINDOWEXPOSED,  # main menu frame cache
+    pygame.WINDOWFOCUSLOST,  # held movement keys (overworld)
+]
+
 
 class Game:
     """Initialiseert runtime-componenten en beheert de hoofdloop."""
@@ -46,6 +57,11 @@ class Game:
         self._screen = pygame.display.set_mode(self._config.resolution)
         pygame.display.set_caption(self._config.title)
         self._clock = pygame.time.Clock()
+        # Alleen events die iemand verwerkt in de queue laten (geen muis, joystick,
+        # touch, audio- of overige window-events), zodat _handle_events niets
+        # hoeft te wrappen en dispatchen dat toch genegeerd wordt
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENT_TYPES)
 
         # Initialize systems
         project_root = Path.cwd()
@@ -186,6 +202,9 @@ class Game:
 
     def _render(self) -> None:
         """Laat de actieve scene tekenen en wissel de buffer."""
+        # Statisch frame (bv. idle main menu): scherm toont het al, niets te doen
+        if not self._scene_manager.needs_render():
+            return
         self._scene_manager.render(self._screen)
         pygame.display.flip()
 
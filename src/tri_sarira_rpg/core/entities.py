@@ -17,7 +17,7 @@ class Entity:
         return {"entity_id": self.entity_id}
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """2D-positie binnen tile-space."""
 
@@ -93,6 +93,10 @@ class SceneManagerProtocol(Protocol):
         """Laat de actieve scene tekenen."""
         ...
 
+    def needs_render(self) -> bool:
+        """Of het volgende frame getekend (en geflipt) moet worden."""
+        ...
+
     def iter_scenes(self) -> Iterable[Scene]:
         """Geef een iterator over alle scenes (handig voor debug)."""
         ...
@@ -135,6 +139,15 @@ class Scene(ABC):
     def render(self, surface: pygame.Surface) -> None:
         """Teken de scene op het doeloppervlak."""
 
+    def is_dirty(self) -> bool:
+        """Of de scene sinds de vorige render iets zichtbaars heeft veranderd.
+
+        Standaard True (elke frame tekenen). Statische scenes kunnen dit
+        overriden zodat de game-loop render en flip overslaat als er niets
+        veranderd is.
+        """
+        return True
+
 
 # =============================================================================
 # SceneStackManager - concrete stack-gebaseerde implementatie
@@ -163,6 +176,7 @@ class SceneStackManager:
 
     def __init__(self) -> None:
         self._scenes: deque[Scene] = deque()
+        self._last_rendered: Scene | None = None
 
     @property
     def active_scene(self) -> Scene | None:
@@ -214,6 +228,18 @@ class SceneStackManager:
         scene = self.active_scene
         if scene:
             scene.render(surface)
+        self._last_rendered = scene
+
+    def needs_render(self) -> bool:
+        """Of het volgende frame getekend moet worden.
+
+        True als de actieve scene dirty is, of als er sinds de vorige render
+        een andere scene actief is geworden (het scherm toont dan nog de oude).
+        """
+        scene = self.active_scene
+        if scene is None:
+            return False
+        return scene is not self._last_rendered or scene.is_dirty()
 
     def iter_scenes(self) -> Iterable[Scene]:
         """Geef een iterator over alle scenes (handig voor debug)."""
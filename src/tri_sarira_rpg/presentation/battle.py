@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import logging
 import random
+from collections import deque
+from collections.abc import Callable
 from enum import Enum
+from itertools import islice
 from typing import TYPE_CHECKING
 
 import pygame
@@ -14,11 +17,14 @@ from tri_sarira_rpg.presentation.theme import (
     Colors,
     FontCache,
     FontSizes,
+    GlyphAtlas,
     Sizes,
     Spacing,
+    TextCache,
     Timing,
 )
 from tri_sarira_rpg.presentation.ui.pause_menu import PauseMenu
+from tri_sarira_rpg.services.game_data import GameDataService
 from tri_sarira_rpg.systems.combat import BattleResult
 from tri_sarira_rpg.systems.combat_viewmodels import (
     ActionType,
@@ -28,6 +34,7 @@ from tri_sarira_rpg.systems.combat_viewmodels import (
     CombatantView,
 )
 from tri_sarira_rpg.systems.inventory import InventorySystem
+from tri_sarira_rpg.systems.progression import STAT_GAIN_DISPLAY
 
 if TYPE_CHECKING:
     from tri_sarira_rpg.core.protocols import (
@@ -39,6 +46,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The two level-up stat lines (labels of StatGains.display_values) and their
+# bit groups in StatGains.positive_mask
+_STAT_LABELS = tuple(label for label, _ in STAT_GAIN_DISPLAY)
+_LINE1_SIZE = 6
+_LINE1_LABELS = _STAT_LABELS[:_LINE1_SIZE]  # HP, STR, END, DEF, SPD, ACC
+_LINE2_LABELS = _STAT_LABELS[_LINE1_SIZE:]  # FOC, INS, WILL, MAG, PRA, RES
+_LINE1_MASK = (1 << _LINE1_SIZE) - 1
+_LINE2_MASK = ((1 << len(_STAT_LABELS)) - 1) & ~_LINE1_MASK
+
+# Action log: messages kept, and how many of the newest are shown
+_LOG_MAX_MESSAGES = 10
+_LOG_VISIBLE_MESSAGES = 5
+
+# HP bar background color and combatant card sizes (cover name, HP and resources)
+_HP_BAR_BG = (50, 50, 50)
+_PARTY_CARD_SIZE = (300, 115)
+_ENEMY_CARD_SIZE = (300, 65)
+
+# Action menu options, in _selected_menu_index order
+_MAIN_MENU_OPTIONS = ("Attack", "Skill", "Defend", "Item")
+
+# Menu input keys (pygame key constants are plain ints, safe at import time)
+_NAV_VERTICAL = {pygame.K_UP: -1, pygame.K_w: -1, pygame.K_DOWN: 1, pygame.K_s: 1}
+_CONFIRM_KEYS = frozenset({pygame.K_RETURN, pygame.K_SPACE})
+_BACK_KEYS = frozenset({pygame.K_ESCAPE, pygame.K_BACKSPACE, pygame.K_q})
+
 
 class BattlePhase(Enum):
     """Fasen van de battle flow."""
@@ -70,6 +103,7 @@ class BattleScene(Scene):
         data_repository: DataRepositoryProtocol,
         party_system: PartySystemProtocol,
         game_instance: GameProtocol | None = None,
+        rng: random.Random | None = None,
     ) -> None:
         super().__init__(manager)
         self._combat = combat_system
@@ -77,9 +111,20 @@ class BattleScene(Scene):
         self._data_repository = data_repository
         self._party = party_system
         self._game = game_instance
+        # Scene-owned RNG for enemy AI; pass a seeded Random for reproducible battles
+        self._rng = rng if rng is not None else random.Random()
+        self._data_service = GameDataService(data_repository)
+        # Memoized item names for menu rows (data is static during a battle)
+        self._item_name_cache: dict[str, str] = {}
         self._phase = BattlePhase.START
         self._menu_state = MenuState.MAIN_MENU
         self._battle_result: BattleResult | None = None  # Stored for rendering
+        self._battle_end_surface: pygame.Surface | None = None  # Retained battle end overlay
+
+        # Snapshot of the combat views; only changes when a turn advances
+        self._state_view: BattleStateView | None = None
+        self._current_actor_view: CombatantView | None = None
+        self._views_stale = True
 
         # UI state
         self._selected_menu_index = 0
@@ -87,14 +132,31 @@ class BattleScene(Scene):
         self._selected_target_index = 0
         self._selected_item_index = 0
 
+        # Per-menu input handlers
+        self._menu_dispatch: dict[MenuState, Callable[[int], None]] = {
+            MenuState.MAIN_MENU: self._handle_main_input,
+            MenuState.SKILL_SELECT: self._handle_skill_input,
+            MenuState.TARGET_SELECT: self._handle_target_input,
+            MenuState.ITEM_SELECT: self._handle_item_input,
+        }
+
         # Action log
-        self._action_log: list[str] = []
+        self._action_log: deque[str] = deque(maxlen=_LOG_MAX_MESSAGES)
         self._log_display_time = 0.0
+        # Only START/ENEMY_TURN and a running log timer need per-frame updates;
+        # PLAYER_TURN and BATTLE_END are idle until input arrives
+        self._needs_update = True
 
         # Fonts (via FontCache)
         self._font = FontCache.get(FontSizes.NORMAL)
         self._font_large = FontCache.get(FontSizes.XLARGE)
         self._font_small = FontCache.get(FontSizes.SMALL)
+        # Rendered HUD/menu/log text; values only change between actions
+        self._text_cache = TextCache()
+        # HP/resource numbers are drawn glyph-by-glyph, so new values never hit FreeType
+        self._number_atlases = {
+            font: GlyphAtlas(font, Colors.TEXT) for font in (self._font, self._font_small)
+        }
 
         # Colors
         self._color_bg = Colors.BG_DARK
@@ -104,6 +166,39 @@ class BattleScene(Scene):
         self._color_hp_low = Colors.HP_LOW
         self._color_enemy = Colors.ENEMY
         self._color_party = Colors.PARTY
+        self._color_gold = Colors.GOLD
+        self._color_success = Colors.SUCCESS
+        self._color_error = Colors.ERROR
+        self._color_stat_gain = Colors.STAT_GAIN
+
+        # Static action menu text, rendered once
+        self._main_menu_surfs = [
+            (
+                self._font.render(f"> {option}", True, self._color_highlight),
+                self._font.render(f"  {option}", True, self._color_text),
+            )
+            for option in _MAIN_MENU_OPTIONS
+        ]
+        self._skill_label_surf = self._font.render("Select Skill:", True, self._color_text)
+        self._item_label_surf = self._font.render("Select Item:", True, self._color_text)
+
+        # Skill/item menu rows: (prefix, color) indexed by "is selected", rendered rows
+        # cached per row content so navigation only swaps surfaces
+        self._row_styles = (("  ", self._color_text), ("> ", self._color_highlight))
+        self._skill_row_cache: dict[tuple[str, bool], pygame.Surface] = {}
+        self._item_row_cache: dict[tuple[str, int, bool], pygame.Surface] = {}
+
+        # Combatant cards: battle_id -> (displayed values, rendered card)
+        self._card_cache: dict[str, tuple[tuple, pygame.Surface]] = {}
+        # Card screen positions per slot; party/enemy counts are fixed for a battle
+        self._party_positions: list[tuple[int, int]] = []
+        self._enemy_positions: list[tuple[int, int]] = []
+        # HP bar rects within a card: fixed background, foreground width set per card
+        self._hp_bar_bg_rect = pygame.Rect((0, 50), Sizes.HP_BAR)
+        self._hp_bar_rect = pygame.Rect((0, 50), Sizes.HP_BAR)
+        # Target highlight outline, moved only when the highlighted enemy slot changes
+        self._target_highlight_rect = pygame.Rect(0, 0, 320, 90)
+        self._target_highlight_slot = -1
 
         # Screen size
         screen = pygame.display.get_surface()
@@ -112,6 +207,12 @@ class BattleScene(Scene):
         else:
             self._screen_width, self._screen_height = Sizes.SCREEN_DEFAULT
 
+        # Semi-transparent log/menu backgrounds (fixed size and color)
+        self._log_bg_surf = pygame.Surface((self._screen_width - 100, 150), pygame.SRCALPHA)
+        self._log_bg_surf.fill((0, 0, 0, 200))
+        self._menu_bg_surf = pygame.Surface((300, 200), pygame.SRCALPHA)
+        self._menu_bg_surf.fill((0, 0, 0, 220))
+
         # Initialize PauseMenu (centered on screen)
         # Note: Load is disabled during battle
         self._paused: bool = False
@@ -156,68 +257,73 @@ class BattleScene(Scene):
                 self._handle_player_input(event.key)
             elif self._phase == BattlePhase.BATTLE_END:
                 # Any key to exit battle
-                if event.key in (pygame.K_SPACE, pygame.K_RETURN):
+                if event.key in _CONFIRM_KEYS:
                     self._exit_battle()
 
     def _handle_player_input(self, key: int) -> None:
         """Handle player input during their turn."""
-        if self._menu_state == MenuState.MAIN_MENU:
-            if key == pygame.K_UP or key == pygame.K_w:
-                self._selected_menu_index = max(0, self._selected_menu_index - 1)
-            elif key == pygame.K_DOWN or key == pygame.K_s:
-                self._selected_menu_index = min(3, self._selected_menu_index + 1)
-            elif key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._confirm_main_menu_selection()
+        self._menu_dispatch[self._menu_state](key)
+
+    def _handle_main_input(self, key: int) -> None:
+        """Handle input in the main action menu."""
+        delta = _NAV_VERTICAL.get(key)
+        if delta is not None:
+            self._selected_menu_index = min(
+                len(_MAIN_MENU_OPTIONS) - 1, max(0, self._selected_menu_index + delta)
+            )
+        elif key in _CONFIRM_KEYS:
+            self._confirm_main_menu_selection()
 
-        elif self._menu_state == MenuState.SKILL_SELECT:
-            current_actor = self._combat.get_current_actor()
-            if not current_actor:
-                return
+    def _handle_skill_input(self, key: int) -> None:
+        """Handle input in the skill selection menu."""
+        current_actor = self._current_actor()
+        if not current_actor:
+            return
 
+        delta = _NAV_VERTICAL.get(key)
+        if delta is not None:
             max_index = len(current_actor.skills) - 1
-            if key == pygame.K_UP or key == pygame.K_w:
-                self._selected_skill_index = max(0, self._selected_skill_index - 1)
-            elif key == pygame.K_DOWN or key == pygame.K_s:
-                self._selected_skill_index = min(max_index, self._selected_skill_index + 1)
-            elif key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._confirm_skill_selection()
-            elif key in (pygame.K_ESCAPE, pygame.K_BACKSPACE, pygame.K_q):
-                self._menu_state = MenuState.MAIN_MENU
-                self._selected_skill_index = 0
-
-        elif self._menu_state == MenuState.TARGET_SELECT:
-            state = self._combat.get_battle_state_view()
-            if not state:
-                return
+            self._selected_skill_index = min(max_index, max(0, self._selected_skill_index + delta))
+        elif key in _CONFIRM_KEYS:
+            self._confirm_skill_selection()
+        elif key in _BACK_KEYS:
+            self._menu_state = MenuState.MAIN_MENU
+            self._selected_skill_index = 0
 
-            alive_enemies = [e for e in state.enemies if e.is_alive]
-            max_index = max(0, len(alive_enemies) - 1)
-            self._selected_target_index = min(self._selected_target_index, max_index)
-
-            # Vertical navigation (enemies staan onder elkaar)
-            if key in (pygame.K_UP, pygame.K_w):
-                self._selected_target_index = max(0, self._selected_target_index - 1)
-            elif key in (pygame.K_DOWN, pygame.K_s):
-                self._selected_target_index = min(max_index, self._selected_target_index + 1)
-            elif key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._confirm_target_selection()
-            elif key in (pygame.K_ESCAPE, pygame.K_BACKSPACE, pygame.K_q):
-                self._menu_state = MenuState.MAIN_MENU
-                self._selected_target_index = 0
+    def _handle_target_input(self, key: int) -> None:
+        """Handle input in the target selection menu."""
+        state = self._battle_view()
+        if not state:
+            return
 
-        elif self._menu_state == MenuState.ITEM_SELECT:
+        alive_enemies = [e for e in state.enemies if e.is_alive]
+        max_index = max(0, len(alive_enemies) - 1)
+        self._selected_target_index = min(self._selected_target_index, max_index)
+
+        # Vertical navigation (enemies staan onder elkaar)
+        delta = _NAV_VERTICAL.get(key)
+        if delta is not None:
+            self._selected_target_index = min(
+                max_index, max(0, self._selected_target_index + delta)
+            )
+        elif key in _CONFIRM_KEYS:
+            self._confirm_target_selection(alive_enemies)
+        elif key in _BACK_KEYS:
+            self._menu_state = MenuState.MAIN_MENU
+            self._selected_target_index = 0
+
+    def _handle_item_input(self, key: int) -> None:
+        """Handle input in the item selection menu."""
+        delta = _NAV_VERTICAL.get(key)
+        if delta is not None:
             available_items = self._inventory.get_available_items()
             max_index = max(0, len(available_items) - 1) if available_items else 0
-
-            if key == pygame.K_UP or key == pygame.K_w:
-                self._selected_item_index = max(0, self._selected_item_index - 1)
-            elif key == pygame.K_DOWN or key == pygame.K_s:
-                self._selected_item_index = min(max_index, self._selected_item_index + 1)
-            elif key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._confirm_item_selection()
-            elif key in (pygame.K_ESCAPE, pygame.K_BACKSPACE, pygame.K_q):
-                self._menu_state = MenuState.MAIN_MENU
-                self._selected_item_index = 0
+            self._selected_item_index = min(max_index, max(0, self._selected_item_index + delta))
+        elif key in _CONFIRM_KEYS:
+            self._confirm_item_selection()
+        elif key in _BACK_KEYS:
+            self._menu_state = MenuState.MAIN_MENU
+            self._selected_item_index = 0
 
     def _confirm_main_menu_selection(self) -> None:
         """Confirm main menu choice."""
@@ -235,7 +341,7 @@ class BattleScene(Scene):
 
     def _confirm_skill_selection(self) -> None:
         """Confirm skill selection."""
-        current_actor = self._combat.get_current_actor()
+        current_actor = self._current_actor()
         if not current_actor or not current_actor.skills:
             return
 
@@ -247,18 +353,16 @@ class BattleScene(Scene):
         self._menu_state = MenuState.TARGET_SELECT
         self._selected_target_index = 0
 
-    def _confirm_target_selection(self) -> None:
-        """Confirm target and execute action."""
-        state = self._combat.get_battle_state_view()
-        if not state:
-            return
+    def _confirm_target_selection(self, alive_enemies: list[CombatantView]) -> None:
+        """Confirm target and execute action.
 
-        current_actor = self._combat.get_current_actor()
+        alive_enemies is the list the target index refers to, as already built by
+        _handle_target_input for the current battle state.
+        """
+        current_actor = self._current_actor()
         if not current_actor:
             return
 
-        # Get alive enemies (is_alive is a property on CombatantView)
-        alive_enemies = [e for e in state.enemies if e.is_alive]
         if not alive_enemies or self._selected_target_index >= len(alive_enemies):
             return
 
@@ -280,7 +384,7 @@ class BattleScene(Scene):
             return
 
         item_id = available_items[self._selected_item_index]
-        current_actor = self._combat.get_current_actor()
+        current_actor = self._current_actor()
         if not current_actor:
             return
 
@@ -312,7 +416,7 @@ class BattleScene(Scene):
 
     def _execute_defend_action(self) -> None:
         """Execute defend."""
-        current_actor = self._combat.get_current_actor()
+        current_actor = self._current_actor()
         if not current_actor:
             return
 
@@ -345,6 +449,8 @@ class BattleScene(Scene):
     def _advance_turn(self) -> None:
         """Advance to next turn and check battle end."""
         self._combat.advance_turn()
+        # The action before this and the turn change both alter the combat views
+        self._views_stale = True
         self._menu_state = MenuState.MAIN_MENU
         self._selected_menu_index = 0
 
@@ -354,6 +460,8 @@ class BattleScene(Scene):
             self._phase = BattlePhase.BATTLE_END
             result = self._combat.get_battle_result(outcome)
             self._battle_result = result  # Store for rendering
+            # Render the end screen now, at result time, so no frame pays for it
+            self._battle_end_surface = self._build_battle_end_surface(result)
             if outcome == BattleOutcome.WIN:
                 self._add_to_log([f"Victory! Earned {result.earned_money} money"])
                 for actor_id, xp in result.earned_xp.items():
@@ -363,19 +471,20 @@ class BattleScene(Scene):
             return
 
         # Determine next phase
-        next_actor = self._combat.get_current_actor()
+        next_actor = self._current_actor()
         if next_actor and next_actor.is_enemy:
             self._phase = BattlePhase.ENEMY_TURN
+            self._needs_update = True
         else:
             self._phase = BattlePhase.PLAYER_TURN
 
     def _execute_enemy_turn(self) -> None:
         """Simple enemy AI: just attack a random party member."""
-        current_enemy = self._combat.get_current_actor()
+        current_enemy = self._current_actor()
         if not current_enemy or not current_enemy.is_enemy:
             return
 
-        state = self._combat.get_battle_state_view()
+        state = self._battle_view()
         if not state:
             return
 
@@ -384,7 +493,7 @@ class BattleScene(Scene):
         if not alive_party:
             return
 
-        target = random.choice(alive_party)
+        target = self._rng.choice(alive_party)
 
         # For v0: enemies just use basic attack or first skill
         if current_enemy.skills:
@@ -408,17 +517,35 @@ class BattleScene(Scene):
         self._add_to_log(messages)
         self._advance_turn()
 
+    def _refresh_views(self) -> None:
+        """Rebuild the cached battle state and current actor views."""
+        self._state_view = self._combat.get_battle_state_view()
+        self._current_actor_view = self._combat.get_current_actor()
+        self._views_stale = False
+
+    def _battle_view(self) -> BattleStateView | None:
+        """Battle state view, rebuilt only after the combat state has changed."""
+        if self._views_stale:
+            self._refresh_views()
+        return self._state_view
+
+    def _current_actor(self) -> CombatantView | None:
+        """Current actor view, rebuilt only after the combat state has changed."""
+        if self._views_stale:
+            self._refresh_views()
+        return self._current_actor_view
+
     def _add_to_log(self, messages: list[str]) -> None:
         """Add messages to action log."""
+        # deque(maxlen) keeps only the last _LOG_MAX_MESSAGES
         self._action_log.extend(messages)
-        # Keep only last 10 messages
-        if len(self._action_log) > 10:
-            self._action_log = self._action_log[-10:]
         self._log_display_time = Timing.LOG_DISPLAY
+        self._needs_update = True
 
     def _exit_battle(self) -> None:
         """Exit battle and return to overworld."""
         logger.info("Exiting battle")
+        self._battle_end_surface = None
         # For now, just pop scene (return to previous scene)
         self.manager.pop_scene()
 
@@ -429,6 +556,10 @@ class BattleScene(Scene):
             self._pause_menu.update(dt)
             return
 
+        # Idle: nothing time-dependent until the player acts
+        if not self._needs_update:
+            return
+
         # Update log display timer
         if self._log_display_time > 0:
             self._log_display_time -= dt
@@ -442,13 +573,18 @@ class BattleScene(Scene):
             # Auto-execute enemy turn after brief delay
             self._execute_enemy_turn()
 
+        self._needs_update = self._log_display_time > 0 or self._phase in (
+            BattlePhase.START,
+            BattlePhase.ENEMY_TURN,
+        )
+
     def render(self, surface: pygame.Surface) -> None:
         """Teken units, UI en feedback."""
         # Clear screen
         surface.fill(self._color_bg)
 
         # Render battle state
-        state = self._combat.get_battle_state_view()
+        state = self._battle_view()
         if state:
             self._render_party(surface, state)
             self._render_enemies(surface, state)
@@ -464,81 +600,138 @@ class BattleScene(Scene):
             self._pause_menu.render(surface)
 
     def _render_party(self, surface: pygame.Surface, state: BattleStateView) -> None:
-        """Render party members."""
-        y_offset = 100
-        for i, member in enumerate(state.party):
-            x = 50
-            y = y_offset + i * 120
-
-            # Draw name
-            name_text = self._font_large.render(member.name, True, self._color_party)
-            surface.blit(name_text, (x, y))
-
-            # Draw HP bar
-            hp_text = self._font.render(
-                f"HP: {member.current_hp}/{member.max_hp}", True, self._color_text
+        """Render party members (cached cards, rebuilt when their values change)."""
+        if len(self._party_positions) != len(state.party):
+            self._party_positions = [(50, 100 + i * 120) for i in range(len(state.party))]
+
+        for member, pos in zip(state.party, self._party_positions, strict=True):
+            key = (
+                member.name,
+                member.current_hp,
+                member.max_hp,
+                member.current_stamina,
+                member.max_stamina,
+                member.current_focus,
+                member.max_focus,
+                member.current_prana,
+                member.max_prana,
             )
-            surface.blit(hp_text, (x, y + 30))
+            cached = self._card_cache.get(member.battle_id)
+            if cached is not None and cached[0] == key:
+                card = cached[1]
+            else:
+                card = self._build_party_card(member)
+                self._card_cache[member.battle_id] = (key, card)
+            surface.blit(card, pos)
 
-            # HP bar visual
-            bar_width, bar_height = Sizes.HP_BAR
-            hp_ratio = member.current_hp / member.max_hp if member.max_hp > 0 else 0
-            bar_color = self._color_hp if hp_ratio > 0.3 else self._color_hp_low
+    def _build_party_card(self, member: CombatantView) -> pygame.Surface:
+        """Render one party member's name, HP bar and resources into a card surface."""
+        card = pygame.Surface(_PARTY_CARD_SIZE, pygame.SRCALPHA)
+        font_small = self._font_small
 
-            pygame.draw.rect(surface, (50, 50, 50), (x, y + 50, bar_width, bar_height))
-            pygame.draw.rect(surface, bar_color, (x, y + 50, int(bar_width * hp_ratio), bar_height))
+        # Draw name
+        card.blit(self._text_cache.render(self._font_large, member.name, self._color_party), (0, 0))
 
-            # Draw resources
-            stamina_text = self._font_small.render(
-                f"Stamina: {member.current_stamina}/{member.max_stamina}",
-                True,
-                self._color_text,
-            )
-            focus_text = self._font_small.render(
-                f"Focus: {member.current_focus}/{member.max_focus}", True, self._color_text
-            )
-            prana_text = self._font_small.render(
-                f"Prana: {member.current_prana}/{member.max_prana}", True, self._color_text
-            )
-            surface.blit(stamina_text, (x, y + 65))
-            surface.blit(focus_text, (x, y + 80))
-            surface.blit(prana_text, (x, y + 95))
+        # Draw HP bar
+        self._blit_counter(card, self._font, "HP: ", member.current_hp, member.max_hp, (0, 30))
+
+        # HP bar visual
+        hp_ratio = member.current_hp / member.max_hp if member.max_hp > 0 else 0
+        bar_color = self._color_hp if hp_ratio > 0.3 else self._color_hp_low
+
+        self._draw_hp_bar(card, hp_ratio, bar_color)
+
+        # Draw resources
+        self._blit_counter(
+            card, font_small, "Stamina: ", member.current_stamina, member.max_stamina, (0, 65)
+        )
+        self._blit_counter(
+            card, font_small, "Focus: ", member.current_focus, member.max_focus, (0, 80)
+        )
+        self._blit_counter(
+            card, font_small, "Prana: ", member.current_prana, member.max_prana, (0, 95)
+        )
+        return card
 
     def _render_enemies(self, surface: pygame.Surface, state: BattleStateView) -> None:
-        """Render enemies."""
-        x_start = self._screen_width - 350
-        y_offset = 100
+        """Render enemies (cached cards, rebuilt when their HP changes)."""
+        if len(self._enemy_positions) != len(state.enemies):
+            x = self._screen_width - 350
+            self._enemy_positions = [(x, 100 + i * 100) for i in range(len(state.enemies))]
+            self._target_highlight_slot = -1
+
+        # Highlight if selected as target (-1 never matches an index)
+        target_index = (
+            self._selected_target_index if self._menu_state == MenuState.TARGET_SELECT else -1
+        )
 
         alive_enemies = [e for e in state.enemies if e.is_alive]
 
+        # Alive enemies fill the first slots (dead ones are skipped, not left as gaps)
+        positions = self._enemy_positions
         for i, enemy in enumerate(alive_enemies):
+            x, y = positions[i]
+            if i == target_index:
+                if self._target_highlight_slot != i:
+                    self._target_highlight_rect.topleft = (x - 10, y - 10)
+                    self._target_highlight_slot = i
+                pygame.draw.rect(surface, self._color_highlight, self._target_highlight_rect, 3)
+
+            key = (enemy.name, enemy.current_hp, enemy.max_hp)
+            cached = self._card_cache.get(enemy.battle_id)
+            if cached is not None and cached[0] == key:
+                card = cached[1]
+            else:
+                card = self._build_enemy_card(enemy)
+                self._card_cache[enemy.battle_id] = (key, card)
+            surface.blit(card, (x, y))
 
-            x = x_start
-            y = y_offset + i * 100
+    def _build_enemy_card(self, enemy: CombatantView) -> pygame.Surface:
+        """Render one enemy's name and HP bar into a card surface."""
+        card = pygame.Surface(_ENEMY_CARD_SIZE, pygame.SRCALPHA)
 
-            # Highlight if selected as target
-            if self._menu_state == MenuState.TARGET_SELECT:
-                if i == self._selected_target_index:
-                    pygame.draw.rect(surface, self._color_highlight, (x - 10, y - 10, 320, 90), 3)
+        # Draw name
+        card.blit(self._text_cache.render(self._font_large, enemy.name, self._color_enemy), (0, 0))
 
-            # Draw name
-            name_text = self._font_large.render(enemy.name, True, self._color_enemy)
-            surface.blit(name_text, (x, y))
+        # Draw HP
+        self._blit_counter(card, self._font, "HP: ", enemy.current_hp, enemy.max_hp, (0, 30))
 
-            # Draw HP
-            hp_text = self._font.render(
-                f"HP: {enemy.current_hp}/{enemy.max_hp}", True, self._color_text
-            )
-            surface.blit(hp_text, (x, y + 30))
+        # HP bar
+        hp_ratio = enemy.current_hp / enemy.max_hp if enemy.max_hp > 0 else 0
 
-            # HP bar
-            bar_width, bar_height = Sizes.HP_BAR
-            hp_ratio = enemy.current_hp / enemy.max_hp if enemy.max_hp > 0 else 0
+        self._draw_hp_bar(card, hp_ratio, self._color_hp)
+        return card
 
-            pygame.draw.rect(surface, (50, 50, 50), (x, y + 50, bar_width, bar_height))
-            pygame.draw.rect(
-                surface, self._color_hp, (x, y + 50, int(bar_width * hp_ratio), bar_height)
-            )
+    def _draw_hp_bar(self, card: pygame.Surface, hp_ratio: float, color: tuple[int, ...]) -> None:
+        """Draw the HP bar background and its filled part into a card."""
+        pygame.draw.rect(card, _HP_BAR_BG, self._hp_bar_bg_rect)
+        bar_rect = self._hp_bar_rect
+        bar_rect.width = int(self._hp_bar_bg_rect.width * hp_ratio)
+        pygame.draw.rect(card, color, bar_rect)
+
+    def _blit_counter(
+        self,
+        surface: pygame.Surface,
+        font: pygame.font.Font,
+        label: str,
+        current: int,
+        maximum: int,
+        pos: tuple[int, int],
+    ) -> None:
+        """Blit "<label><current>/<maximum>": label via TextCache, numbers via glyph atlas.
+
+        Tekens buiten de atlas-charset (bijv. een '-') vallen terug op de TextCache.
+        """
+        x, y = pos
+        label_surf = self._text_cache.render(font, label, self._color_text)
+        surface.blit(label_surf, pos)
+        numbers = f"{current}/{maximum}"
+        numbers_pos = (x + font.size(label)[0], y)
+        atlas = self._number_atlases[font]
+        if atlas.supports(numbers):
+            atlas.blit(surface, numbers, numbers_pos)
+        else:
+            surface.blit(self._text_cache.render(font, numbers, Colors.TEXT), numbers_pos)
 
     def _render_action_log(self, surface: pygame.Surface) -> None:
         """Render action log messages."""
@@ -549,18 +742,17 @@ class BattleScene(Scene):
         y = self._screen_height - 200
 
         # Draw log background
-        log_bg = pygame.Surface((self._screen_width - 100, 150), pygame.SRCALPHA)
-        log_bg.fill((0, 0, 0, 200))
-        surface.blit(log_bg, (x, y))
+        surface.blit(self._log_bg_surf, (x, y))
 
         # Draw messages
-        for i, message in enumerate(self._action_log[-5:]):  # Last 5 messages
-            text = self._font.render(message, True, self._color_text)
+        start = max(0, len(self._action_log) - _LOG_VISIBLE_MESSAGES)
+        for i, message in enumerate(islice(self._action_log, start, None)):
+            text = self._text_cache.render(self._font, message, self._color_text)
             surface.blit(text, (x + 10, y + 10 + i * 25))
 
     def _render_action_menu(self, surface: pygame.Surface) -> None:
         """Render action selection menu."""
-        current_actor = self._combat.get_current_actor()
+        current_actor = self._current_actor()
         if not current_actor or current_actor.is_enemy:
             return
 
@@ -569,113 +761,126 @@ class BattleScene(Scene):
         menu_y = self._screen_height - 390
 
         # Draw menu background
-        menu_bg = pygame.Surface((300, 200), pygame.SRCALPHA)
-        menu_bg.fill((0, 0, 0, 220))
-        surface.blit(menu_bg, (menu_x, menu_y))
+        surface.blit(self._menu_bg_surf, (menu_x, menu_y))
 
         # Draw menu title
-        title_text = self._font_large.render(
-            f"{current_actor.name}'s Turn", True, self._color_highlight
+        title_text = self._text_cache.render(
+            self._font_large, f"{current_actor.name}'s Turn", self._color_highlight
         )
         surface.blit(title_text, (menu_x + 10, menu_y + 10))
 
         if self._menu_state == MenuState.MAIN_MENU:
-            # Main menu options
-            options = ["Attack", "Skill", "Defend", "Item"]
-            for i, option in enumerate(options):
-                color = (
-                    self._color_highlight if i == self._selected_menu_index else self._color_text
-                )
-                text = self._font.render(
-                    f"> {option}" if i == self._selected_menu_index else f"  {option}", True, color
-                )
+            # Main menu options (pre-rendered as (selected, unselected) pairs)
+            for i, (selected, unselected) in enumerate(self._main_menu_surfs):
+                text = selected if i == self._selected_menu_index else unselected
                 surface.blit(text, (menu_x + 20, menu_y + 50 + i * 30))
 
         elif self._menu_state == MenuState.SKILL_SELECT:
             # Skill selection
-            title = self._font.render("Select Skill:", True, self._color_text)
-            surface.blit(title, (menu_x + 20, menu_y + 50))
+            surface.blit(self._skill_label_surf, (menu_x + 20, menu_y + 50))
 
+            selected_index = self._selected_skill_index
             for i, skill_id in enumerate(current_actor.skills):
-                color = (
-                    self._color_highlight if i == self._selected_skill_index else self._color_text
-                )
-                # Get skill name from data
-                skill_data = self._data_repository.get_skill(skill_id)
-                skill_name = skill_data.get("name", skill_id) if skill_data else skill_id
-
-                # Get resource cost
-                cost_text = ""
-                if skill_data and "resource_cost" in skill_data:
-                    cost_type = skill_data["resource_cost"].get("type", "")
-                    cost_amount = skill_data["resource_cost"].get("amount", 0)
-                    cost_text = f" ({cost_amount} {cost_type.capitalize()})"
-
-                display_text = (
-                    f"> {skill_name}{cost_text}"
-                    if i == self._selected_skill_index
-                    else f"  {skill_name}{cost_text}"
-                )
-                text = self._font_small.render(display_text, True, color)
+                text = self._skill_row(skill_id, i == selected_index)
                 surface.blit(text, (menu_x + 20, menu_y + 80 + i * 25))
 
         elif self._menu_state == MenuState.ITEM_SELECT:
             # Item selection
-            title = self._font.render("Select Item:", True, self._color_text)
-            surface.blit(title, (menu_x + 20, menu_y + 50))
+            surface.blit(self._item_label_surf, (menu_x + 20, menu_y + 50))
 
             available_items = self._inventory.get_available_items()
             if not available_items:
                 # No items available
-                no_items_text = self._font_small.render(
-                    "No items available", True, self._color_text
+                no_items_text = self._text_cache.render(
+                    self._font_small, "No items available", self._color_text
                 )
                 surface.blit(no_items_text, (menu_x + 20, menu_y + 80))
             else:
+                selected_index = self._selected_item_index
                 for i, item_id in enumerate(available_items):
                     qty = self._inventory.get_quantity(item_id)
-                    color = (
-                        self._color_highlight
-                        if i == self._selected_item_index
-                        else self._color_text
-                    )
+                    text = self._item_row(item_id, qty, i == selected_index)
+                    surface.blit(text, (menu_x + 20, menu_y + 80 + i * 25))
 
-                    # Get item name from data
-                    item_data = self._data_repository.get_item(item_id)
-                    item_name = item_data.get("name", item_id) if item_data else item_id
+    def _skill_row(self, skill_id: str, selected: bool) -> pygame.Surface:
+        """Rendered skill menu row ("> name (cost)"), cached per (skill_id, selected)."""
+        key = (skill_id, selected)
+        row = self._skill_row_cache.get(key)
+        if row is None:
+            # Get skill name and resource cost from data
+            skill_info = self._data_service.get_skill_info(skill_id)
+            skill_name = skill_info.name if skill_info else skill_id
+            cost_text = f" ({skill_info.cost_text})" if skill_info and skill_info.cost_text else ""
+
+            prefix, color = self._row_styles[selected]
+            row = self._font_small.render(f"{prefix}{skill_name}{cost_text}", True, color)
+            self._skill_row_cache[key] = row
+        return row
+
+    def _item_row(self, item_id: str, qty: int, selected: bool) -> pygame.Surface:
+        """Rendered item menu row ("> name (qty)"), cached per (item_id, qty, selected)."""
+        key = (item_id, qty, selected)
+        row = self._item_row_cache.get(key)
+        if row is None:
+            prefix, color = self._row_styles[selected]
+            row = self._font_small.render(
+                f"{prefix}{self._item_name(item_id)} ({qty})", True, color
+            )
+            self._item_row_cache[key] = row
+        return row
 
-                    display_text = (
-                        f"> {item_name} ({qty})"
-                        if i == self._selected_item_index
-                        else f"  {item_name} ({qty})"
-                    )
-                    text = self._font_small.render(display_text, True, color)
-                    surface.blit(text, (menu_x + 20, menu_y + 80 + i * 25))
+    def _item_name(self, item_id: str) -> str:
+        """Memoized GameDataService.get_item_name (static data for the whole battle)."""
+        name = self._item_name_cache.get(item_id)
+        if name is None:
+            name = self._data_service.get_item_name(item_id)
+            self._item_name_cache[item_id] = name
+        return name
 
     def _render_battle_end(self, surface: pygame.Surface) -> None:
-        """Render battle end screen with clear visual blocks."""
+        """Render battle end screen (retained overlay, built once per BattleResult)."""
         if not self._battle_result:
             return
 
-        result = self._battle_result
+        if self._battle_end_surface is None:
+            self._battle_end_surface = self._build_battle_end_surface(self._battle_result)
+        surface.blit(self._battle_end_surface, (0, 0))
+
+    def _build_battle_end_surface(self, result: BattleResult) -> pygame.Surface:
+        """Render the battle end screen with clear visual blocks into an off-screen overlay.
+
+        The content only depends on the BattleResult and the post-battle party state,
+        so it is rendered once and blitted every frame until the result changes.
+        """
+        surface = pygame.Surface((self._screen_width, self._screen_height), pygame.SRCALPHA)
+        # All text is collected first and drawn with a single Surface.blits call
+        blit_ops: list[tuple[pygame.Surface, pygame.Rect]] = []
+
         outcome_text = "VICTORY!" if result.outcome == BattleOutcome.WIN else "DEFEAT..."
-        outcome_color = Colors.SUCCESS if result.outcome == BattleOutcome.WIN else Colors.ERROR
+        outcome_color = (
+            self._color_success if result.outcome == BattleOutcome.WIN else self._color_error
+        )
+
+        # Loop-invariant lookups, bound once instead of per line/character
+        center_x = self._screen_width // 2
+        stat_line_step = Spacing.LG
+        render_large = self._font_large.render
+        render = self._font.render
+        render_small = self._font_small.render
 
         # === BLOCK 1: Outcome Header ===
-        text = self._font_large.render(outcome_text, True, outcome_color)
-        text_rect = text.get_rect(center=(self._screen_width // 2, 120))
-        surface.blit(text, text_rect)
+        text = render_large(outcome_text, True, outcome_color)
+        text_rect = text.get_rect(center=(center_x, 120))
+        blit_ops.append((text, text_rect))
 
         y_offset = 180  # Start position for rewards/level-ups
 
         # === BLOCK 2: Rewards (if WIN) ===
         if result.outcome == BattleOutcome.WIN:
             # Total XP
-            total_xp_text = self._font.render(
-                f"Total XP: {result.total_xp}", True, self._color_text
-            )
-            total_xp_rect = total_xp_text.get_rect(center=(self._screen_width // 2, y_offset))
-            surface.blit(total_xp_text, total_xp_rect)
+            total_xp_text = render(f"Total XP: {result.total_xp}", True, self._color_text)
+            total_xp_rect = total_xp_text.get_rect(center=(center_x, y_offset))
+            blit_ops.append((total_xp_text, total_xp_rect))
             y_offset += 28
 
             # XP distribution per party member
@@ -691,13 +896,13 @@ class BattleScene(Scene):
                             pm_state.actor_id.replace("mc_", "").replace("comp_", "").capitalize()
                         )
 
-                        xp_line = self._font_small.render(
+                        xp_line = render_small(
                             f"{actor_name}: LV {current_level} (XP +{xp})",
                             True,
                             self._color_party,
                         )
-                        xp_line_rect = xp_line.get_rect(center=(self._screen_width // 2, y_offset))
-                        surface.blit(xp_line, xp_line_rect)
+                        xp_line_rect = xp_line.get_rect(center=(center_x, y_offset))
+                        blit_ops.append((xp_line, xp_line_rect))
                         y_offset += 22
                     else:
                         logger.warning(
@@ -709,92 +914,75 @@ class BattleScene(Scene):
                 y_offset += 20  # Extra spacing before level-up block
 
                 # Level-up header
-                level_up_header = self._font.render("LEVEL UP!", True, Colors.GOLD)
-                level_up_header_rect = level_up_header.get_rect(
-                    center=(self._screen_width // 2, y_offset)
-                )
-                surface.blit(level_up_header, level_up_header_rect)
+                level_up_header = render("LEVEL UP!", True, self._color_gold)
+                level_up_header_rect = level_up_header.get_rect(center=(center_x, y_offset))
+                blit_ops.append((level_up_header, level_up_header_rect))
                 y_offset += 32
 
                 # Each character's level-up
                 for level_up in result.level_ups:
                     # Character name and level change
-                    level_up_text = self._font_small.render(
+                    level_up_text = render_small(
                         f"{level_up.actor_name}: Lv {level_up.old_level} → Lv {level_up.new_level}",
                         True,
-                        Colors.GOLD,
-                    )
-                    level_up_rect = level_up_text.get_rect(
-                        center=(self._screen_width // 2, y_offset)
+                        self._color_gold,
                     )
-                    surface.blit(level_up_text, level_up_rect)
+                    level_up_rect = level_up_text.get_rect(center=(center_x, y_offset))
+                    blit_ops.append((level_up_text, level_up_rect))
                     y_offset += 22
 
-                    # Stat gains - split into two lines for readability
+                    # Stat gains - split into two lines for readability.
+                    # The bitmask lets level-ups without visible gains skip the block.
                     gains = level_up.stat_gains
-                    line1_parts = []
-                    line2_parts = []
-
-                    # Line 1: HP and primary stats (6 stats max)
-                    for stat, value in [
-                        ("HP", gains.max_hp),
-                        ("STR", gains.STR),
-                        ("END", gains.END),
-                        ("DEF", gains.DEF),
-                        ("SPD", gains.SPD),
-                        ("ACC", gains.ACC),
-                    ]:
-                        if value > 0:
-                            line1_parts.append(f"{stat} +{value}")
-
-                    # Line 2: Mental/spiritual stats
-                    for stat, value in [
-                        ("FOC", gains.FOC),
-                        ("INS", gains.INS),
-                        ("WILL", gains.WILL),
-                        ("MAG", gains.MAG),
-                        ("PRA", gains.PRA),
-                        ("RES", gains.RES),
-                    ]:
-                        if value > 0:
-                            line2_parts.append(f"{stat} +{value}")
-
-                    # Render line 1
-                    if line1_parts:
-                        line1_text = self._font_small.render(
-                            ", ".join(line1_parts), True, Colors.STAT_GAIN
-                        )
-                        line1_rect = line1_text.get_rect(center=(self._screen_width // 2, y_offset))
-                        surface.blit(line1_text, line1_rect)
-                        y_offset += Spacing.LG
-
-                    # Render line 2
-                    if line2_parts:
-                        line2_text = self._font_small.render(
-                            ", ".join(line2_parts), True, Colors.STAT_GAIN
-                        )
-                        line2_rect = line2_text.get_rect(center=(self._screen_width // 2, y_offset))
-                        surface.blit(line2_text, line2_rect)
-                        y_offset += Spacing.LG
+                    gain_mask = gains.positive_mask
+                    if gain_mask:
+                        # Line 1: HP and primary stats, line 2: mental/spiritual stats
+                        values = gains.display_values
+
+                        # Render line 1
+                        if gain_mask & _LINE1_MASK:
+                            line1_text = self._render_stat_line(_LINE1_LABELS, values[:_LINE1_SIZE])
+                            line1_rect = line1_text.get_rect(center=(center_x, y_offset))
+                            blit_ops.append((line1_text, line1_rect))
+                            y_offset += stat_line_step
+
+                        # Render line 2
+                        if gain_mask & _LINE2_MASK:
+                            line2_text = self._render_stat_line(_LINE2_LABELS, values[_LINE1_SIZE:])
+                            line2_rect = line2_text.get_rect(center=(center_x, y_offset))
+                            blit_ops.append((line2_text, line2_rect))
+                            y_offset += stat_line_step
 
                     y_offset += 10  # Extra spacing between characters
 
             # === BLOCK 4: Money ===
             if result.earned_money > 0:
                 y_offset += 10
-                money_text = self._font.render(
-                    f"Money: {result.earned_money} gold", True, self._color_text
-                )
-                money_rect = money_text.get_rect(center=(self._screen_width // 2, y_offset))
-                surface.blit(money_text, money_rect)
+                money_text = render(f"Money: {result.earned_money} gold", True, self._color_text)
+                money_rect = money_text.get_rect(center=(center_x, y_offset))
+                blit_ops.append((money_text, money_rect))
                 y_offset += 30
 
         # === BLOCK 5: Continue Prompt (always at bottom) ===
         # Use dynamic y_offset to avoid overlap, with minimum bottom position
         prompt_y = max(y_offset + 30, self._screen_height - 60)
-        prompt = self._font.render("Press SPACE to continue", True, self._color_text)
-        prompt_rect = prompt.get_rect(center=(self._screen_width // 2, prompt_y))
-        surface.blit(prompt, prompt_rect)
+        prompt = render("Press SPACE to continue", True, self._color_text)
+        prompt_rect = prompt.get_rect(center=(center_x, prompt_y))
+        blit_ops.append((prompt, prompt_rect))
+
+        surface.blits(blit_ops, doreturn=False)
+
+        # Match the display pixel format once, so the per-frame blit needs no conversion
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def _render_stat_line(self, labels: tuple[str, ...], values: tuple[int, ...]) -> pygame.Surface:
+        """Render one level-up stat line (via the scene's TextCache)."""
+        line = ", ".join(
+            f"{stat} +{value}" for stat, value in zip(labels, values, strict=True) if value > 0
+        )
+        return self._text_cache.render(self._font_small, line, self._color_stat_gain)
 
 
 __all__ = ["BattleScene"]
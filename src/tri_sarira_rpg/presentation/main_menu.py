@@ -16,6 +16,7 @@ from tri_sarira_rpg.presentation.theme import (
     FontSizes,
     Sizes,
     Spacing,
+    TextCache,
     Timing,
 )
 
@@ -71,7 +72,8 @@ class MainMenuScene(Scene):
         self._feedback_message: str = ""
         self._feedback_timer: float = 0.0
 
-        # Cache for slot info to avoid loading save files every frame
+        # Cache for slot info to avoid loading save files every frame; filled once
+        # per scene (see update), since saves are never written from the main menu
         self._slot_info_cache: dict[int, str] = {}
         self._cache_valid: bool = False
 
@@ -81,11 +83,17 @@ class MainMenuScene(Scene):
             self._screen_width, self._screen_height = screen.get_size()
         else:
             self._screen_width, self._screen_height = Sizes.SCREEN_DEFAULT
+        self._screen_cx = self._screen_width // 2  # Horizontal center for all menu text
 
         # Fonts (via FontCache)
         self._font_title = FontCache.get(FontSizes.HERO, bold=True)
         self._font_menu = FontCache.get(FontSizes.XLARGE)
         self._font_info = FontCache.get(FontSizes.NORMAL)
+        # Menu text is (nearly) static; render each (font, text, color) only once
+        self._text_cache = TextCache()
+        # Retained full menu frame, redrawn only when _view_key() changes
+        self._frame: pygame.Surface | None = None
+        self._frame_key: tuple | None = None
 
         # Colors
         self._bg_color = Colors.BG_DARK
@@ -93,14 +101,34 @@ class MainMenuScene(Scene):
         self._highlight_color = Colors.HIGHLIGHT
         self._title_color = Colors.TITLE
 
-        # Main menu options
-        self._main_options = [
-            ("Continue", MainMenuOption.CONTINUE),
-            ("New Game", MainMenuOption.NEW_GAME),
-            ("Load Game", MainMenuOption.LOAD_GAME),
-            ("Options", MainMenuOption.OPTIONS),
-            ("Quit", MainMenuOption.QUIT),
+        # Main menu options (parallel sequences, indexed by _selected_index)
+        self._main_option_labels = ("Continue", "New Game", "Load Game", "Options", "Quit")
+        self._main_option_values = (
+            MainMenuOption.CONTINUE,
+            MainMenuOption.NEW_GAME,
+            MainMenuOption.LOAD_GAME,
+            MainMenuOption.OPTIONS,
+            MainMenuOption.QUIT,
+        )
+        # Option labels rendered up front: normal and highlighted variant per row
+        self._main_option_surfaces = [
+            self._text_cache.render(self._font_menu, label, self._text_color)
+            for label in self._main_option_labels
+        ]
+        self._main_option_highlight_surfaces = [
+            self._text_cache.render(self._font_menu, label, self._highlight_color)
+            for label in self._main_option_labels
+        ]
+        # Selection caret, blitted left of the selected row (labels carry no prefix)
+        self._caret_surface = self._text_cache.render(self._font_menu, "►", self._highlight_color)
+        self._caret_gap = self._font_menu.size(" ")[0]
+
+        # Row centers for main options and save slots (screen size is fixed)
+        center_x = self._screen_cx
+        self._main_option_centers = [
+            (center_x, 300 + i * 50) for i in range(len(self._main_option_labels))
         ]
+        self._slot_centers = [(center_x, 220 + i * 50) for i in range(5)]
 
         logger.info("MainMenuScene initialized")
 
@@ -112,7 +140,10 @@ class MainMenuScene(Scene):
         event : pygame.event.Event
             Pygame event
         """
-        if event.type == pygame.KEYDOWN:
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # Window content was lost; force a redraw + flip of the retained frame
+            self._frame_key = None
+        elif event.type == pygame.KEYDOWN:
             if self._state == MainMenuState.MAIN:
                 self._handle_main_menu_input(event.key)
             elif self._state == MainMenuState.LOAD_SELECT:
@@ -130,9 +161,9 @@ class MainMenuScene(Scene):
         """
         # Navigation
         if key in (pygame.K_UP, pygame.K_w):
-            self._selected_index = (self._selected_index - 1) % len(self._main_options)
+            self._selected_index = (self._selected_index - 1) % len(self._main_option_values)
         elif key in (pygame.K_DOWN, pygame.K_s):
-            self._selected_index = (self._selected_index + 1) % len(self._main_options)
+            self._selected_index = (self._selected_index + 1) % len(self._main_option_values)
 
         # Selection
         elif key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_z):
@@ -140,7 +171,7 @@ class MainMenuScene(Scene):
 
     def _execute_main_menu_option(self) -> None:
         """Execute selected main menu option."""
-        _, option = self._main_options[self._selected_index]
+        option = self._main_option_values[self._selected_index]
 
         if option == MainMenuOption.NEW_GAME:
             self._start_new_game()
@@ -149,8 +180,8 @@ class MainMenuScene(Scene):
         elif option == MainMenuOption.LOAD_GAME:
             self._state = MainMenuState.LOAD_SELECT
             self._selected_slot = 0
-            # Invalidate cache when entering load menu
-            self._cache_valid = False
+            # Slot cache stays valid: nothing can write a save while the main menu
+            # is active (the game always returns here with a fresh MainMenuScene)
         elif option == MainMenuOption.OPTIONS:
             self._state = MainMenuState.OPTIONS
         elif option == MainMenuOption.QUIT:
@@ -298,6 +329,50 @@ class MainMenuScene(Scene):
     def render(self, surface: pygame.Surface) -> None:
         """Render main menu.
 
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Surface to render on
+        """
+        # Redraw the retained frame only when something visible changed
+        view_key = self._view_key()
+        frame = self._frame
+        if frame is None or frame.get_size() != surface.get_size():
+            frame = pygame.Surface(surface.get_size())
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert()
+            self._frame = frame
+            self._frame_key = None
+        if view_key != self._frame_key:
+            self._draw_frame(frame)
+            self._frame_key = view_key
+
+        surface.blit(frame, (0, 0))
+
+    def is_dirty(self) -> bool:
+        """True when the menu frame is stale; an idle menu needs no render or flip."""
+        return self._frame_key is None or self._view_key() != self._frame_key
+
+    def _view_key(self) -> tuple:
+        """Everything the menu frame depends on; a new key means the frame is stale."""
+        feedback = self._feedback_message if self._feedback_timer > 0 else None
+        slot_infos = (
+            tuple(self._slot_info_cache.values())
+            if self._state == MainMenuState.LOAD_SELECT
+            else None
+        )
+        return (
+            self._state,
+            self._selected_index,
+            self._selected_slot,
+            self._latest_save_slot,
+            feedback,
+            slot_infos,
+        )
+
+    def _draw_frame(self, surface: pygame.Surface) -> None:
+        """Draw the full menu frame (background, current state, feedback).
+
         Parameters
         ----------
         surface : pygame.Surface
@@ -326,29 +401,29 @@ class MainMenuScene(Scene):
             Surface to render on
         """
         # Title
-        title_text = self._font_title.render("Tri-Śarīra RPG", True, self._title_color)
-        title_rect = title_text.get_rect(center=(self._screen_width // 2, 150))
-        surface.blit(title_text, title_rect)
+        title_text = self._text_cache.render(self._font_title, "Tri-Śarīra RPG", self._title_color)
+        title_rect = title_text.get_rect(center=(self._screen_cx, 150))
+        blit_ops = [(title_text, title_rect)]
 
         # Menu options
-        start_y = 300
-        for i, (text, option) in enumerate(self._main_options):
-            is_continue = option == MainMenuOption.CONTINUE
-            continue_available = self._latest_save_slot is not None
-
-            label = text
-            if is_continue and not continue_available:
-                label = "Continue (no saves)"
-
-            if is_continue and not continue_available:
-                color = Colors.TEXT_MUTED
+        continue_available = self._latest_save_slot is not None
+        selected_index = self._selected_index
+        for i, option in enumerate(self._main_option_values):
+            if option == MainMenuOption.CONTINUE and not continue_available:
+                option_text = self._text_cache.render(
+                    self._font_menu, "Continue (no saves)", Colors.TEXT_MUTED
+                )
+            elif i == selected_index:
+                option_text = self._main_option_highlight_surfaces[i]
             else:
-                color = self._highlight_color if i == self._selected_index else self._text_color
+                option_text = self._main_option_surfaces[i]
+            option_rect = option_text.get_rect(center=self._main_option_centers[i])
+            blit_ops.append((option_text, option_rect))
+            if i == selected_index:
+                blit_ops.append(self._caret_blit(option_rect))
 
-            prefix = "► " if i == self._selected_index else "  "
-            option_text = self._font_menu.render(f"{prefix}{label}", True, color)
-            option_rect = option_text.get_rect(center=(self._screen_width // 2, start_y + i * 50))
-            surface.blit(option_text, option_rect)
+        # One call into SDL for title + all options
+        surface.blits(blit_ops, doreturn=False)
 
     def _render_load_select(self, surface: pygame.Surface) -> None:
         """Render load slot selection.
@@ -359,31 +434,39 @@ class MainMenuScene(Scene):
             Surface to render on
         """
         # Title
-        title_text = self._font_title.render("Load Game", True, self._title_color)
-        title_rect = title_text.get_rect(center=(self._screen_width // 2, 100))
-        surface.blit(title_text, title_rect)
+        title_text = self._text_cache.render(self._font_title, "Load Game", self._title_color)
+        title_rect = title_text.get_rect(center=(self._screen_cx, 100))
 
         # Instructions
-        info_text = self._font_info.render(
-            "Select a save slot (Esc to return)", True, self._text_color
+        info_text = self._text_cache.render(
+            self._font_info, "Select a save slot (Esc to return)", self._text_color
         )
-        info_rect = info_text.get_rect(center=(self._screen_width // 2, 150))
-        surface.blit(info_text, info_rect)
+        info_rect = info_text.get_rect(center=(self._screen_cx, 150))
+        blit_ops = [(title_text, title_rect), (info_text, info_rect)]
 
         # Save slots
-        start_y = 220
         for i in range(5):
             slot_id = i + 1
-            color = self._highlight_color if i == self._selected_slot else self._text_color
-            prefix = "► " if i == self._selected_slot else "  "
+            selected = i == self._selected_slot
+            color = self._highlight_color if selected else self._text_color
 
             # Check if slot exists and get info
             slot_info = self._get_slot_info(slot_id)
-            slot_text = f"{prefix}Slot {slot_id}: {slot_info}"
+            slot_text = f"Slot {slot_id}: {slot_info}"
+
+            text_surface = self._text_cache.render(self._font_menu, slot_text, color)
+            text_rect = text_surface.get_rect(center=self._slot_centers[i])
+            blit_ops.append((text_surface, text_rect))
+            if selected:
+                blit_ops.append(self._caret_blit(text_rect))
 
-            text_surface = self._font_menu.render(slot_text, True, color)
-            text_rect = text_surface.get_rect(center=(self._screen_width // 2, start_y + i * 50))
-            surface.blit(text_surface, text_rect)
+        surface.blits(blit_ops, doreturn=False)
+
+    def _caret_blit(self, row_rect: pygame.Rect) -> tuple[pygame.Surface, pygame.Rect]:
+        """Blit op for the selection caret, left of a row and vertically centered on it."""
+        caret = self._caret_surface
+        caret_rect = caret.get_rect(midright=(row_rect.left - self._caret_gap, row_rect.centery))
+        return caret, caret_rect
 
     def _get_slot_info(self, slot_id: int) -> str:
         """Get info about a save slot.
@@ -439,11 +522,11 @@ class MainMenuScene(Scene):
             self._slot_info_cache[slot_id] = info
 
         # If no saves, move selection to New Game for convenience
-        if self._latest_save_slot is None and self._main_options[self._selected_index][1] == MainMenuOption.CONTINUE:
-            for idx, (_, opt) in enumerate(self._main_options):
-                if opt == MainMenuOption.NEW_GAME:
-                    self._selected_index = idx
-                    break
+        if (
+            self._latest_save_slot is None
+            and self._main_option_values[self._selected_index] == MainMenuOption.CONTINUE
+        ):
+            self._selected_index = self._main_option_values.index(MainMenuOption.NEW_GAME)
 
         self._cache_valid = True
 
@@ -479,20 +562,22 @@ class MainMenuScene(Scene):
             Surface to render on
         """
         # Title
-        title_text = self._font_title.render("Options", True, self._title_color)
-        title_rect = title_text.get_rect(center=(self._screen_width // 2, 200))
+        title_text = self._text_cache.render(self._font_title, "Options", self._title_color)
+        title_rect = title_text.get_rect(center=(self._screen_cx, 200))
         surface.blit(title_text, title_rect)
 
         # Stub message
-        stub_text = self._font_menu.render("Options are not available yet", True, self._text_color)
-        stub_rect = stub_text.get_rect(center=(self._screen_width // 2, 300))
+        stub_text = self._text_cache.render(
+            self._font_menu, "Options are not available yet", self._text_color
+        )
+        stub_rect = stub_text.get_rect(center=(self._screen_cx, 300))
         surface.blit(stub_text, stub_rect)
 
         # Instructions
-        info_text = self._font_info.render(
-            "Press Esc or Enter to return", True, self._text_color
+        info_text = self._text_cache.render(
+            self._font_info, "Press Esc or Enter to return", self._text_color
         )
-        info_rect = info_text.get_rect(center=(self._screen_width // 2, 350))
+        info_rect = info_text.get_rect(center=(self._screen_cx, 350))
         surface.blit(info_text, info_rect)
 
     def _render_feedback(self, surface: pygame.Surface) -> None:
@@ -506,10 +591,10 @@ class MainMenuScene(Scene):
         if not self._feedback_message:
             return
 
-        feedback_text = self._font_info.render(self._feedback_message, True, Colors.ERROR)
-        feedback_rect = feedback_text.get_rect(
-            center=(self._screen_width // 2, self._screen_height - 50)
+        feedback_text = self._text_cache.render(
+            self._font_info, self._feedback_message, Colors.ERROR
         )
+        feedback_rect = feedback_text.get_rect(center=(self._screen_cx, self._screen_height - 50))
         surface.blit(feedback_text, feedback_rect)
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import pygame
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
         FlagsSystemProtocol,
         GameProtocol,
         InventorySystemProtocol,
+        PartyMemberProtocol,
         PartySystemProtocol,
         QuestSystemProtocol,
         ShopSystemProtocol,
@@ -31,6 +33,7 @@ from tri_sarira_rpg.presentation.theme import (
     FontSizes,
     Sizes,
     Spacing,
+    TextCache,
     Timing,
 )
 from tri_sarira_rpg.presentation.ui.dialogue_box import DialogueBox
@@ -49,6 +52,63 @@ from tri_sarira_rpg.systems.state import GameStateFlags
 
 logger = logging.getLogger(__name__)
 
+# Toetsgroepen voor handle_event (module-level, geen tuple/attribute lookups per event)
+_DISMISS_KEYS = frozenset({pygame.K_SPACE, pygame.K_RETURN, pygame.K_z, pygame.K_x})
+_EQUIPMENT_CLOSE_KEYS = frozenset({pygame.K_i, pygame.K_ESCAPE})
+_INTERACT_KEYS = frozenset({pygame.K_SPACE, pygame.K_RETURN, pygame.K_e})
+_ADVANCE_KEYS = frozenset({pygame.K_SPACE, pygame.K_RETURN})
+
+# LOD-drempels (pixels): kleinere tiles krijgen geen grid border,
+# kleinere chests worden als één pixel gemarkeerd
+_LOD_MIN_GRID_TILE_SIZE = 12
+_LOD_MIN_CHEST_SIZE = 4
+
+# Bewegingstoetsen in prioriteitsvolgorde: (toets, alternatieve toets, dx, dy)
+_MOVE_BINDINGS: tuple[tuple[int, int, int, int], ...] = (
+    (pygame.K_w, pygame.K_UP, 0, -1),
+    (pygame.K_s, pygame.K_DOWN, 0, 1),
+    (pygame.K_a, pygame.K_LEFT, -1, 0),
+    (pygame.K_d, pygame.K_RIGHT, 1, 0),
+)
+
+# Eén bit per bewegingstoets; toets en alternatieve toets apart, zodat het loslaten
+# van de een de ander niet wist
+_MOVE_KEY_BITS: dict[int, int] = {
+    key: 1 << (2 * index + slot)
+    for index, binding in enumerate(_MOVE_BINDINGS)
+    for slot, key in enumerate(binding[:2])
+}
+
+
+def _resolve_move(held: int) -> tuple[int, int]:
+    """Geef (dx, dy) van de eerste richting in _MOVE_BINDINGS met een ingedrukte toets."""
+    for index, (_, _, dx, dy) in enumerate(_MOVE_BINDINGS):
+        if held & (0b11 << (2 * index)):
+            return (dx, dy)
+    return (0, 0)
+
+
+# (dx, dy) per bitmask van ingedrukte bewegingstoetsen
+_MOVE_LUT: tuple[tuple[int, int], ...] = tuple(
+    _resolve_move(held) for held in range(1 << (2 * len(_MOVE_BINDINGS)))
+)
+
+# Eenheidsvector per kijkrichting (richtingsindicator van de speler)
+_FACING_VECTORS: dict[str, tuple[int, int]] = {
+    "N": (0, -1),
+    "S": (0, 1),
+    "E": (1, 0),
+    "W": (-1, 0),
+}
+
+# Follower-offset per kijkrichting: één tile achter de voorganger
+_FOLLOWER_OFFSETS: dict[str, tuple[int, int]] = {
+    "N": (0, 1),  # If player faces North, follower is South
+    "S": (0, -1),  # If player faces South, follower is North
+    "E": (-1, 0),  # If player faces East, follower is West
+    "W": (1, 0),  # If player faces West, follower is East
+}
+
 
 class OverworldScene(Scene):
     """Overworld scene met map rendering en player movement."""
@@ -85,6 +145,10 @@ class OverworldScene(Scene):
         self._static_map_surface: pygame.Surface | None = None
         self._static_map_zone_id: str | None = None
         self._static_map_shape: tuple[int, int, int] | None = None  # (width, height, tile_size)
+        # Prerendered (walkable, blocked) tiles with grid border, keyed by tile_size
+        self._tile_surfaces: dict[int, tuple[pygame.Surface, pygame.Surface]] = {}
+        # Prerendered player/follower sprites (zie _get_character_sprite)
+        self._character_sprites: dict[tuple, pygame.Surface] = {}
 
         # Dialogue system and UI (injected via constructor)
         self._dialogue_system = dialogue_system
@@ -118,32 +182,48 @@ class OverworldScene(Scene):
         # Movement timing (tile-based)
         self._move_cooldown: float = 0.0
         self._move_delay: float = Timing.MOVE_DELAY
+        # Bitmask van ingedrukte bewegingstoetsen (zie _MOVE_KEY_BITS), via KEYDOWN/KEYUP
+        self._held_moves: int = 0
+        # Actieve party voor dit frame (zie _get_active_party), gereset in update()
+        self._frame_party: list[PartyMemberProtocol] | None = None
 
         # Camera (simple follow)
         self._camera_x: int = 0
         self._camera_y: int = 0
+        # Map en speler-tile waarvoor de camera het laatst is berekend
+        self._camera_map: object | None = None
+        self._camera_player_tile: tuple[int, int] | None = None
+        # Per map gecachte camera-waarden (gezet bij een mapwissel in _update_camera)
+        self._camera_tile_size: int = 0
+        self._camera_max_x: int = 0
+        self._camera_max_y: int = 0
+        self._map_view_rect = pygame.Rect(0, 0, self._screen_width, self._screen_height)
 
         # Fonts for HUD (via FontCache)
         self._font = FontCache.get(FontSizes.NORMAL)
         self._font_large = FontCache.get(FontSizes.XLARGE)
+        # Gerenderde tekst (message overlay blijft vaak meerdere frames staan)
+        self._text_cache = TextCache()
+        # _view_key() van het frame dat nu op het scherm staat (None = opnieuw tekenen)
+        self._frame_key: tuple | None = None
 
-        # Initialize DialogueBox (at bottom of screen)
+        # DialogueBox rect (at bottom of screen); box built on first use
         dialogue_height = Sizes.DIALOGUE_HEIGHT
         dialogue_y = self._screen_height - dialogue_height - Sizes.DIALOGUE_MARGIN
-        dialogue_rect = pygame.Rect(
+        self._dialogue_rect = pygame.Rect(
             Sizes.DIALOGUE_MARGIN,
             dialogue_y,
             self._screen_width - Sizes.DIALOGUE_MARGIN * 2,
             dialogue_height,
         )
-        self._dialogue_box = DialogueBox(dialogue_rect)
 
-        # Initialize QuestLogUI (centered on screen)
+        # QuestLogUI rect (centered on screen); UI built on first use
         quest_log_width, quest_log_height = Sizes.QUEST_LOG
         quest_log_x = (self._screen_width - quest_log_width) // 2
         quest_log_y = (self._screen_height - quest_log_height) // 2
-        quest_log_rect = pygame.Rect(quest_log_x, quest_log_y, quest_log_width, quest_log_height)
-        self._quest_log_ui = QuestLogUI(quest_log_rect)
+        self._quest_log_rect = pygame.Rect(
+            quest_log_x, quest_log_y, quest_log_width, quest_log_height
+        )
 
         # Initialize PauseMenu (centered on screen)
         self._paused: bool = False
@@ -170,6 +250,23 @@ class OverworldScene(Scene):
             Sizes.DIALOGUE_HEIGHT,
         )
 
+        # Overworld hotkeys: toets -> handler (dispatch in handle_event)
+        self._keydown_handlers: dict[int, Callable[[], None]] = {
+            pygame.K_q: self._toggle_quest_log,  # Quest log toggle
+            pygame.K_i: self._toggle_equipment_menu,  # Inventory/Equipment
+            **dict.fromkeys(_INTERACT_KEYS, self._world.interact),
+            pygame.K_F5: self._quick_save,  # Save game (industry standard)
+            pygame.K_F9: self._quick_load,  # Load game (industry standard)
+            # Debug keys
+            pygame.K_n: self._debug_start_dialogue,  # Step 6 Dialogue v0
+            pygame.K_j: self._debug_toggle_rajani,  # Step 4 v0
+            pygame.K_b: self._debug_start_battle,  # Step 5 Combat v0
+            pygame.K_t: self._debug_start_quest,  # Step 7 Quest v0
+            pygame.K_y: self._debug_advance_quest,  # Step 7 Quest v0
+            pygame.K_u: self._debug_complete_quest,  # Step 7 Quest v0
+            pygame.K_g: self._debug_open_shop,  # Step 8 Shop v0
+        }
+
         # Register callbacks with world system
         self._world.attach_systems(
             on_show_message=self._enqueue_message,
@@ -182,10 +279,25 @@ class OverworldScene(Scene):
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Verwerk input events."""
+        # Ingedrukte bewegingstoetsen bijhouden, ook als een overlay de input krijgt
+        # (net als key.get_pressed(): een toets die in een menu ingedrukt blijft telt mee)
+        if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+            bit = _MOVE_KEY_BITS.get(event.key)
+            if bit is not None:
+                if event.type == pygame.KEYDOWN:
+                    self._held_moves |= bit
+                else:
+                    self._held_moves &= ~bit
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self._held_moves = 0
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # Window content was lost; force a redraw + flip
+            self._frame_key = None
+
         if event.type == pygame.KEYDOWN:
             # Message overlay has priority
             if self._active_message:
-                if event.key in (pygame.K_SPACE, pygame.K_RETURN, pygame.K_z, pygame.K_x):
+                if event.key in _DISMISS_KEYS:
                     self._dismiss_message()
                 return
 
@@ -202,7 +314,7 @@ class OverworldScene(Scene):
             # Priority 1.5: If equipment menu is visible, route to equipment menu UI
             if self._equipment_menu_visible:
                 # Allow quick toggle close with the same key (I) or Esc
-                if event.key in (pygame.K_i, pygame.K_ESCAPE):
+                if event.key in _EQUIPMENT_CLOSE_KEYS:
                     self._equipment_menu_visible = False
                     logger.debug("Closing equipment menu via toggle")
                     return
@@ -252,56 +364,16 @@ class OverworldScene(Scene):
                     logger.debug("Resuming from pause menu")
                 return
 
-            # Quest log toggle (Q key)
-            if event.key == pygame.K_q:
-                self._toggle_quest_log()
-
-            # Equipment menu toggle (I key for Inventory/Equipment)
-            elif event.key == pygame.K_i:
-                self._toggle_equipment_menu()
-
-            # Interact key
-            elif event.key in (pygame.K_SPACE, pygame.K_RETURN, pygame.K_e):
-                self._world.interact()
-
-            # Save game (F5 key - industry standard)
-            elif event.key == pygame.K_F5:
-                self._quick_save()
-
-            # Load game (F9 key - industry standard)
-            elif event.key == pygame.K_F9:
-                self._quick_load()
-
-            # Debug key: Start dialogue (Step 6 Dialogue v0)
-            elif event.key == pygame.K_n:
-                self._debug_start_dialogue()
-
-            # Debug key: Toggle Rajani in/out of party (Step 4 v0)
-            elif event.key == pygame.K_j:
-                self._debug_toggle_rajani()
-
-            # Debug key: Start battle (Step 5 Combat v0)
-            elif event.key == pygame.K_b:
-                self._debug_start_battle()
-
-            # Debug key: Start test quest (Step 7 Quest v0)
-            elif event.key == pygame.K_t:
-                self._debug_start_quest()
-
-            # Debug key: Advance test quest (Step 7 Quest v0)
-            elif event.key == pygame.K_y:
-                self._debug_advance_quest()
-
-            # Debug key: Complete test quest (Step 7 Quest v0)
-            elif event.key == pygame.K_u:
-                self._debug_complete_quest()
-
-            # Debug key: Open shop (Step 8 Shop v0)
-            elif event.key == pygame.K_g:
-                self._debug_open_shop()
+            # Overworld hotkeys (zie _keydown_handlers)
+            handler = self._keydown_handlers.get(event.key)
+            if handler is not None:
+                handler()
 
     def update(self, dt: float) -> None:
         """Update overworld logic."""
+        # Party kan sinds de vorige frame gewijzigd zijn (events, debug keys, load)
+        self._frame_party = None
+
         # If paused, only update pause menu
         if self._paused:
             self._pause_menu.update(dt)
@@ -337,26 +409,13 @@ class OverworldScene(Scene):
             self._move_cooldown -= dt
 
         # Handle movement input
-        if self._move_cooldown <= 0:
-            keys = pygame.key.get_pressed()
-
-            dx, dy = 0, 0
-
-            # WASD / Arrow keys
-            if keys[pygame.K_w] or keys[pygame.K_UP]:
-                dy = -1
-            elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                dy = 1
-            elif keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                dx = -1
-            elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                dx = 1
-
-            if dx != 0 or dy != 0:
-                # Try to move
-                moved = self._world.move_player(dx, dy)
-                if moved:
-                    self._move_cooldown = self._move_delay
+        if self._move_cooldown <= 0 and self._held_moves:
+            # WASD / Arrow keys; first held direction wins
+            dx, dy = _MOVE_LUT[self._held_moves]
+            # Try to move
+            moved = self._world.move_player(dx, dy)
+            if moved:
+                self._move_cooldown = self._move_delay
 
         # Update camera to follow player
         self._update_camera()
@@ -369,11 +428,8 @@ class OverworldScene(Scene):
         # Render map
         self._render_map(surface)
 
-        # Render followers (before player so player is on top)
-        self._render_followers(surface)
-
-        # Render player
-        self._render_player(surface)
+        # Render followers and player (player last so it is on top)
+        self._render_characters(surface)
 
         # Render HUD
         self._render_hud(surface)
@@ -402,6 +458,45 @@ class OverworldScene(Scene):
         if self._active_message:
             self._render_message(surface, self._active_message)
 
+        self._frame_key = self._view_key()
+
+    def is_dirty(self) -> bool:
+        """True when the overworld frame is stale; an idle player needs no render or flip."""
+        return self._frame_key is None or self._view_key() != self._frame_key
+
+    def _view_key(self) -> tuple | None:
+        """Alles waar het overworld-frame van afhangt; een nieuwe key betekent een stale frame.
+
+        None zolang een overlay (dialogue, quest log, shop, equipment, pauze) open is:
+        die UI's houden hun eigen state bij, dus dan wordt elke frame getekend.
+        """
+        if (
+            self._dialogue_session
+            or self._quest_log_visible
+            or self._shop_menu_visible
+            or self._equipment_menu_visible
+            or self._paused
+        ):
+            return None
+        player = self._world.player
+        player_key = (player.position.x, player.position.y, player.facing) if player else None
+        party_key = tuple(
+            (member.actor_id, member.level, member.is_main_character)
+            for member in self._get_active_party()
+        )
+        feedback = self._feedback_message if self._feedback_timer > 0 else None
+        return (
+            self._world.current_zone_id,
+            player_key,
+            self._camera_x,
+            self._camera_y,
+            party_key,
+            self._party.party_max_size,
+            self._time.get_time_display(),
+            feedback,
+            self._active_message,
+        )
+
     def _update_camera(self) -> None:
         """Update camera om player te volgen."""
         if not self._world.player or not self._world.current_map:
@@ -410,36 +505,44 @@ class OverworldScene(Scene):
         player = self._world.player
         tiled_map = self._world.current_map
 
-        # Center camera on player
-        screen_center_x = self._screen_width // 2
-        screen_center_y = self._screen_height // 2
-
-        tile_size = tiled_map.tile_width
-
-        # Calculate camera position (top-left corner in pixels)
-        self._camera_x = (player.position.x * tile_size) - screen_center_x
-        self._camera_y = (player.position.y * tile_size) - screen_center_y
-
-        # Clamp camera to map bounds
-        max_camera_x = (tiled_map.width * tile_size) - self._screen_width
-        max_camera_y = (tiled_map.height * tile_size) - self._screen_height
+        # Alleen herberekenen als speler of map veranderd is
+        player_tile = (player.position.x, player.position.y)
+        if tiled_map is not self._camera_map:
+            # Map-afhankelijke waarden één keer per map: tile size en camera bounds
+            tile_size = tiled_map.tile_width
+            self._camera_tile_size = tile_size
+            self._camera_max_x = max(0, tiled_map.width * tile_size - self._screen_width)
+            self._camera_max_y = max(0, tiled_map.height * tile_size - self._screen_height)
+            self._camera_map = tiled_map
+        elif player_tile == self._camera_player_tile:
+            return
+        self._camera_player_tile = player_tile
 
-        self._camera_x = max(0, min(self._camera_x, max(0, max_camera_x)))
-        self._camera_y = max(0, min(self._camera_y, max(0, max_camera_y)))
+        # Center camera on player (top-left corner in pixels), clamped to map bounds
+        tile_size = self._camera_tile_size
+        camera_x = player.position.x * tile_size - self._screen_width // 2
+        camera_y = player.position.y * tile_size - self._screen_height // 2
+        max_x = self._camera_max_x
+        max_y = self._camera_max_y
+        self._camera_x = 0 if camera_x < 0 else (max_x if camera_x > max_x else camera_x)
+        self._camera_y = 0 if camera_y < 0 else (max_y if camera_y > max_y else camera_y)
 
     def _render_map(self, surface: pygame.Surface) -> None:
         """Render de Tiled map."""
         tiled_map = self._world.current_map
         if not tiled_map:
             # No map loaded, show placeholder
-            text = self._font_large.render("No map loaded", True, Colors.TEXT_WHITE)
+            text = self._text_cache.render(self._font_large, "No map loaded", Colors.TEXT_WHITE)
             surface.blit(text, (400, 300))
             return
 
         self._ensure_static_map_surface(tiled_map)
 
         if self._static_map_surface:
-            surface.blit(self._static_map_surface, (-self._camera_x, -self._camera_y))
+            # Alleen het zichtbare deel van de map blitten
+            view = self._map_view_rect
+            view.topleft = (self._camera_x, self._camera_y)
+            surface.blit(self._static_map_surface, (0, 0), view)
 
     def _ensure_static_map_surface(self, tiled_map) -> None:
         """Bouw of reuse een prerendered surface voor statische tilelagen."""
@@ -461,23 +564,37 @@ class OverworldScene(Scene):
         surface = pygame.Surface((width_px, height_px))
         surface.fill(Colors.BG_DARK)
 
-        for y in range(tiled_map.height):
-            for x in range(tiled_map.width):
-                rect = (x * tile_size, y * tile_size, tile_size, tile_size)
-                is_blocked = tiled_map.get_collision_at(x, y)
-                color = Colors.TILE_BLOCKED if is_blocked else Colors.TILE_WALKABLE
-                pygame.draw.rect(surface, color, rect)
-                pygame.draw.rect(surface, Colors.TILE_GRID, rect, 1)
+        tile_walkable, tile_blocked = self._get_tile_surfaces(tile_size)
+        # Pixel offsets per kolom/rij eenmalig; de loop zelf vermenigvuldigt niet
+        col_xs = range(0, width_px, tile_size)
+        row_ys = range(0, height_px, tile_size)
+        surface.blits(
+            [
+                (tile_blocked if is_blocked else tile_walkable, (x_px, y_px))
+                for y_px, row in zip(row_ys, tiled_map.collision_grid, strict=True)
+                for x_px, is_blocked in zip(col_xs, row, strict=True)
+            ],
+            doreturn=False,
+        )
 
         for portal in tiled_map.get_portals():
             portal_x, portal_y = portal.get_tile_coords(tile_size)
             rect = (portal_x * tile_size, portal_y * tile_size, tile_size, tile_size)
             pygame.draw.rect(surface, Colors.PORTAL, rect, 3)
 
+        chest_size = tile_size - 8
         for chest in tiled_map.get_chests():
             chest_x, chest_y = chest.get_tile_coords(tile_size)
-            rect = (chest_x * tile_size + 4, chest_y * tile_size + 4, tile_size - 8, tile_size - 8)
-            pygame.draw.rect(surface, Colors.CHEST, rect)
+            if chest_size < _LOD_MIN_CHEST_SIZE:
+                # LOD: te klein voor een rect, markeer alleen het midden van de tile
+                center = (
+                    chest_x * tile_size + tile_size // 2,
+                    chest_y * tile_size + tile_size // 2,
+                )
+                surface.set_at(center, Colors.CHEST)
+                continue
+            rect = (chest_x * tile_size + 4, chest_y * tile_size + 4, chest_size, chest_size)
+            surface.fill(Colors.CHEST, rect)
 
         # Convert for faster blits if display is available
         display_surface = pygame.display.get_surface()
@@ -488,14 +605,64 @@ class OverworldScene(Scene):
         self._static_map_zone_id = zone_id
         self._static_map_shape = shape
 
-    def _render_followers(self, surface: pygame.Surface) -> None:
-        """Render party followers (Step 4 v0)."""
+    def _get_tile_surfaces(self, tile_size: int) -> tuple[pygame.Surface, pygame.Surface]:
+        """Geef (walkable, blocked) tile surfaces, met grid border vanaf de LOD-drempel."""
+        tiles = self._tile_surfaces.get(tile_size)
+        if tiles is None:
+            display_surface = pygame.display.get_surface()
+            built = []
+            for color in (Colors.TILE_WALKABLE, Colors.TILE_BLOCKED):
+                tile = pygame.Surface((tile_size, tile_size))
+                tile.fill(color)
+                if tile_size >= _LOD_MIN_GRID_TILE_SIZE:
+                    pygame.draw.rect(tile, Colors.TILE_GRID, tile.get_rect(), 1)
+                built.append(tile.convert() if display_surface else tile)
+            tiles = (built[0], built[1])
+            self._tile_surfaces[tile_size] = tiles
+        return tiles
+
+    def _get_character_sprite(
+        self,
+        tile_size: int,
+        color: tuple[int, int, int],
+        indicator_color: tuple[int, int, int],
+        indicator_offset: tuple[int, int],
+        indicator_radius: int,
+    ) -> pygame.Surface:
+        """Geef een tile-grote sprite: cirkel met indicator (offset t.o.v. het midden)."""
+        key = (tile_size, color, indicator_color, indicator_offset, indicator_radius)
+        sprite = self._character_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+            center = (tile_size // 2, tile_size // 2)
+            pygame.draw.circle(sprite, color, center, tile_size // 3)
+            pygame.draw.circle(
+                sprite,
+                indicator_color,
+                (center[0] + indicator_offset[0], center[1] + indicator_offset[1]),
+                indicator_radius,
+            )
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._character_sprites[key] = sprite
+        return sprite
+
+    def _render_characters(self, surface: pygame.Surface) -> None:
+        """Blit followers en speler in één blits()-aanroep (lijstvolgorde = diepte)."""
         player = self._world.player
         if not player or not self._world.current_map:
             return
 
+        draws: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._collect_follower_draws(draws)
+        self._collect_player_draw(draws)
+        surface.blits(draws, doreturn=False)
+
+    def _collect_follower_draws(self, draws: list[tuple[pygame.Surface, tuple[int, int]]]) -> None:
+        """Voeg (sprite, pos) toe voor zichtbare party followers (Step 4 v0)."""
+        player = self._world.player
         tile_size = self._world.current_map.tile_width
-        active_party = self._party.get_active_party()
+        active_party = self._get_active_party()
 
         # Skip first member (MC/player)
         followers = active_party[1:]
@@ -503,31 +670,33 @@ class OverworldScene(Scene):
             return
 
         # Calculate follower positions (1 tile behind player, then chain)
-        # Start with player position
+        # Start with player position; the chain keeps the player's facing,
+        # so every follower steps by the same offset
         current_x, current_y = player.position.x, player.position.y
-        current_facing = player.facing
-
-        # Facing offset (opposite direction for followers)
-        facing_offset = {
-            "N": (0, 1),  # If player faces North, follower is South
-            "S": (0, -1),  # If player faces South, follower is North
-            "E": (-1, 0),  # If player faces East, follower is West
-            "W": (1, 0),  # If player faces West, follower is East
-        }
+        step_dx, step_dy = _FOLLOWER_OFFSETS.get(player.facing, (0, 1))
 
         for i, follower in enumerate(followers):
             # Calculate follower tile position (1 tile behind previous)
-            dx, dy = facing_offset.get(current_facing, (0, 1))
-            follower_tile_x = current_x + dx
-            follower_tile_y = current_y + dy
+            follower_tile_x = current_x + step_dx
+            follower_tile_y = current_y + step_dy
+
+            # Update position for next follower
+            current_x, current_y = follower_tile_x, follower_tile_y
 
             # Convert to screen coords
             screen_x = (follower_tile_x * tile_size) - self._camera_x
             screen_y = (follower_tile_y * tile_size) - self._camera_y
 
+            # Skip followers outside the viewport
+            if (
+                screen_x + tile_size <= 0
+                or screen_y + tile_size <= 0
+                or screen_x >= self._screen_width
+                or screen_y >= self._screen_height
+            ):
+                continue
+
             # Draw follower as green circle (different color from player)
-            center_x = screen_x + tile_size // 2
-            center_y = screen_y + tile_size // 2
             radius = tile_size // 3
 
             # Color variation for different followers
@@ -536,44 +705,33 @@ class OverworldScene(Scene):
             else:
                 color = Colors.FOLLOWER_DARK  # Darker green for additional followers
 
-            pygame.draw.circle(surface, color, (center_x, center_y), radius)
-
-            # Draw small indicator showing this is a follower
-            pygame.draw.circle(
-                surface, Colors.FOLLOWER_INDICATOR, (center_x, center_y - radius // 2), radius // 4
+            # Small indicator showing this is a follower
+            sprite = self._get_character_sprite(
+                tile_size, color, Colors.FOLLOWER_INDICATOR, (0, -(radius // 2)), radius // 4
             )
+            draws.append((sprite, (screen_x, screen_y)))
 
-            # Update position for next follower
-            current_x, current_y = follower_tile_x, follower_tile_y
-            # Keep same facing for chain
-
-    def _render_player(self, surface: pygame.Surface) -> None:
-        """Render de speler."""
+    def _collect_player_draw(self, draws: list[tuple[pygame.Surface, tuple[int, int]]]) -> None:
+        """Voeg (sprite, pos) van de speler toe."""
         player = self._world.player
-        if not player or not self._world.current_map:
-            return
-
         tile_size = self._world.current_map.tile_width
 
         screen_x = (player.position.x * tile_size) - self._camera_x
         screen_y = (player.position.y * tile_size) - self._camera_y
 
-        # Draw player as blue circle
-        center_x = screen_x + tile_size // 2
-        center_y = screen_y + tile_size // 2
+        # Player as blue circle with a direction indicator
         radius = tile_size // 3
+        ux, uy = _FACING_VECTORS.get(player.facing, (0, 0))
+        sprite = self._get_character_sprite(
+            tile_size, Colors.PLAYER, Colors.TEXT_WHITE, (ux * radius, uy * radius), radius // 3
+        )
+        draws.append((sprite, (screen_x, screen_y)))
 
-        pygame.draw.circle(surface, Colors.PLAYER, (center_x, center_y), radius)
-
-        # Draw direction indicator
-        facing_offset = {
-            "N": (0, -radius),
-            "S": (0, radius),
-            "E": (radius, 0),
-            "W": (-radius, 0),
-        }
-        dx, dy = facing_offset.get(player.facing, (0, 0))
-        pygame.draw.circle(surface, Colors.TEXT_WHITE, (center_x + dx, center_y + dy), radius // 3)
+    def _get_active_party(self) -> list[PartyMemberProtocol]:
+        """Actieve party, één keer per frame opgehaald (render, HUD en view key delen hem)."""
+        if self._frame_party is None:
+            self._frame_party = self._party.get_active_party()
+        return self._frame_party
 
     def _build_hud_data(self) -> HUDData:
         """Bouw HUDData view model voor de HUD component.
@@ -587,7 +745,7 @@ class OverworldScene(Scene):
             View model met alle data die de HUD nodig heeft
         """
         # Build party member info list
-        active_party = self._party.get_active_party()
+        active_party = self._get_active_party()
         party_members = [
             PartyMemberInfo(
                 name=member.actor_id.replace("mc_", "").replace("comp_", "").capitalize(),
@@ -709,6 +867,8 @@ class OverworldScene(Scene):
             self._party,
             game_instance=self._game,
         )
+        # KEYUPs gaan straks naar de battle scene; begin daarna met losgelaten toetsen
+        self._held_moves = 0
         self.manager.push_scene(battle_scene)
 
     def _start_dialogue_from_event(self, dialogue_id: str) -> None:
@@ -722,7 +882,7 @@ class OverworldScene(Scene):
         session = self._dialogue_system.start_dialogue(dialogue_id, context)
         if session:
             self._dialogue_session = session
-            self._dialogue_box.set_session(session)
+            self._update_dialogue_view()
         else:
             logger.warning(f"Dialogue {dialogue_id} not found or failed to start")
 
@@ -731,7 +891,7 @@ class OverworldScene(Scene):
         pygame.draw.rect(surface, Colors.BG_OVERLAY, self._message_rect, border_radius=8)
         pygame.draw.rect(surface, Colors.BORDER, self._message_rect, width=2, border_radius=8)
 
-        text_surface = self._font.render(message, True, Colors.TEXT)
+        text_surface = self._text_cache.render(self._font, message, Colors.TEXT)
         text_rect = text_surface.get_rect()
         text_rect.center = self._message_rect.center
         surface.blit(text_surface, text_rect)
@@ -755,6 +915,8 @@ class OverworldScene(Scene):
             self._party,
             game_instance=self._game,
         )
+        # KEYUPs gaan straks naar de battle scene; begin daarna met losgelaten toetsen
+        self._held_moves = 0
         self.manager.push_scene(battle_scene)
 
     def _debug_start_dialogue(self) -> None:
@@ -802,7 +964,7 @@ class OverworldScene(Scene):
                 self._update_dialogue_view()
         else:
             # Check for continue/advance (Space/Enter when no choices)
-            if event.key in (pygame.K_SPACE, pygame.K_RETURN):
+            if event.key in _ADVANCE_KEYS:
                 view = self._dialogue_system.get_current_view(self._dialogue_session)
                 if not view:
                     # No view means conversation ended
@@ -825,9 +987,15 @@ class OverworldScene(Scene):
                         logger.info("Dialogue ended (no choices, player continued)")
                         self._dialogue_session = None
 
+    def _ensure_dialogue_box(self) -> DialogueBox:
+        """Geef de DialogueBox, bij de eerste dialogue pas aangemaakt."""
+        if self._dialogue_box is None:
+            self._dialogue_box = DialogueBox(self._dialogue_rect)
+        return self._dialogue_box
+
     def _update_dialogue_view(self) -> None:
         """Update dialogue box met huidige node view."""
-        if not self._dialogue_session or not self._dialogue_box:
+        if not self._dialogue_session:
             return
 
         view = self._dialogue_system.get_current_view(self._dialogue_session)
@@ -840,10 +1008,16 @@ class OverworldScene(Scene):
         choices = [(c.choice_id, c.text) for c in view.choices]
 
         # Update dialogue box
-        self._dialogue_box.set_content(view.speaker_id, view.lines, choices)
+        self._ensure_dialogue_box().set_content(view.speaker_id, view.lines, choices)
+
+    def _ensure_quest_log_ui(self) -> QuestLogUI:
+        """Geef de QuestLogUI, pas aangemaakt als de quest log voor het eerst opent."""
+        if self._quest_log_ui is None:
+            self._quest_log_ui = QuestLogUI(self._quest_log_rect)
+        return self._quest_log_ui
 
     def _refresh_quest_log(self) -> None:
-        """Refresh quest log UI with current quest data."""
+        """Refresh quest log UI with current quest data (no-op until first opened)."""
         if not self._quest or not self._quest_log_ui:
             return
 
@@ -861,6 +1035,7 @@ class OverworldScene(Scene):
 
         if self._quest_log_visible:
             # Refresh quest log when opening
+            self._ensure_quest_log_ui()
             self._refresh_quest_log()
             logger.info("Quest log opened")
         else:
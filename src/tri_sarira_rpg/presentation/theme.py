@@ -7,16 +7,18 @@ Dit bestand bevat alle visuele constanten voor de game UI:
 - Component afmetingen
 - Menu color schemes (frozen dataclasses)
 - Font caching
+- Text surface caching en glyph atlases
 - ThemeProvider voor dependency injection
 
 Gebruik:
     from tri_sarira_rpg.presentation.theme import Colors, FontSizes, Spacing, Sizes
-    from tri_sarira_rpg.presentation.theme import MenuColors, DialogueColors, FontCache
+    from tri_sarira_rpg.presentation.theme import MenuColors, DialogueColors, FontCache, TextCache
     from tri_sarira_rpg.presentation.theme import UITheme, ThemeProviderProtocol, DefaultThemeProvider
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
@@ -217,6 +219,11 @@ class FontCache:
     Voorkomt herhaalde pygame.font.SysFont() aanroepen door fonts
     te cachen op basis van (family, size, bold) key.
 
+    Bewust pygame.font en geen pygame.freetype: tekst wordt via TextCache en
+    GlyphAtlas eenmalig gerasterd en daarna alleen nog geblit, dus freetype's
+    render_to/glyph-cache levert niets extra op en zou een tweede font-API
+    (en FontCache-variant) naast de bestaande vereisen.
+
     Gebruik:
         font = FontCache.get(FontSizes.NORMAL)
         font_bold = FontCache.get(FontSizes.TITLE, bold=True)
@@ -271,6 +278,152 @@ class FontCache:
         cls._initialized = False
 
 
+# =============================================================================
+# Text Cache - vermijdt herhaalde font.render aanroepen
+# =============================================================================
+
+
+class TextCache:
+    """Begrensde LRU-cache voor gerenderde tekst-surfaces.
+
+    font.render() rasteriseert de tekst bij elke aanroep opnieuw. UI-tekst
+    verandert zelden tussen frames, dus een blit van een gecachte surface is
+    veel goedkoper. De cache is per scene/component en gekeyed op
+    (font, text, color); de oudste entry valt eruit bij maxsize. Zodra er een
+    display is, worden surfaces met convert_alpha() in display-formaat opgeslagen.
+
+    Gebruik:
+        cache = TextCache()
+        surface.blit(cache.render(font, "HP: 10/20", Colors.TEXT), (x, y))
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize text cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum aantal gecachte surfaces
+        """
+        self._maxsize = maxsize
+        self._cache: OrderedDict[tuple[pygame.Font, str, tuple], pygame.Surface]
+        self._cache = OrderedDict()
+
+    def render(self, font: pygame.Font, text: str, color: tuple) -> pygame.Surface:
+        """Haal een (antialiased) tekst-surface op, rendert alleen bij een cache miss.
+
+        Parameters
+        ----------
+        font : pygame.Font
+            Font om mee te renderen (gebruik FontCache)
+        text : str
+            Te renderen tekst
+        color : tuple
+            Tekstkleur
+
+        Returns
+        -------
+        pygame.Surface
+            Gecachte tekst-surface; niet muteren
+        """
+        key = (font, text, color)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        import pygame
+
+        rendered = font.render(text, True, color)
+        # Eenmalig naar display-formaat, zodat elke latere blit geen pixelconversie doet
+        if pygame.display.get_surface() is not None:
+            rendered = rendered.convert_alpha()
+        self._cache[key] = rendered
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        """Leeg de cache (bv. na een font- of resolutiewissel)."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class GlyphAtlas:
+    """Vooraf gerenderde glyphs van één font/kleur in één atlas-surface.
+
+    Bedoeld voor korte, snel wisselende strings met een kleine charset
+    (HP/resource tellers): elke glyph wordt één keer gerasterd, daarna is een
+    string alleen nog een reeks blits uit de atlas.
+
+    Gebruik:
+        atlas = GlyphAtlas(font, Colors.TEXT)
+        atlas.blit(surface, "84/84", (x, y))
+    """
+
+    DIGITS = "0123456789/: "
+
+    def __init__(self, font: pygame.Font, color: tuple, charset: str = DIGITS) -> None:
+        """Render de charset één keer naar een atlas.
+
+        Parameters
+        ----------
+        font : pygame.Font
+            Font om mee te renderen (gebruik FontCache)
+        color : tuple
+            Tekstkleur
+        charset : str
+            Tekens die de atlas moet bevatten
+        """
+        import pygame
+
+        rendered = [(char, font.render(char, True, color)) for char in dict.fromkeys(charset)]
+        width = sum(glyph.get_width() for _, glyph in rendered)
+        # Sommige glyphs (bijv. haakjes) zijn hoger dan font.get_height()
+        height = max([font.get_height(), *(glyph.get_height() for _, glyph in rendered)])
+        atlas = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+
+        areas: list[tuple[str, tuple[int, int, int, int]]] = []
+        x = 0
+        for char, glyph in rendered:
+            glyph_width = glyph.get_width()
+            atlas.blit(glyph, (x, 0))
+            areas.append((char, (x, 0, glyph_width, glyph.get_height())))
+            x += glyph_width
+
+        # Eenmalig naar display-formaat (net als TextCache), vóór de subsurfaces
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        self._atlas = atlas
+
+        # char -> (atlas subsurface, advance)
+        self._glyphs: dict[str, tuple[pygame.Surface, int]] = {
+            char: (atlas.subsurface(area), font.size(char)[0]) for char, area in areas
+        }
+
+    def supports(self, text: str) -> bool:
+        """Of alle tekens van text in de atlas zitten."""
+        glyphs = self._glyphs
+        return all(char in glyphs for char in text)
+
+    def blit(self, surface: pygame.Surface, text: str, pos: tuple[int, int]) -> int:
+        """Teken text vanuit de atlas en geef de x-positie na de laatste glyph terug.
+
+        Alle tekens moeten in de charset zitten (zie supports()).
+        """
+        x, y = pos
+        glyphs = self._glyphs
+        ops = []
+        for char in text:
+            glyph, advance = glyphs[char]
+            ops.append((glyph, (x, y)))
+            x += advance
+        surface.blits(ops, doreturn=False)
+        return x
+
+
 # =============================================================================
 # UITheme - composable theme object
 # =============================================================================
@@ -372,6 +525,8 @@ __all__ = [
     "MenuColors",
     "DialogueColors",
     "FontCache",
+    "TextCache",
+    "GlyphAtlas",
     "UITheme",
     "ThemeProviderProtocol",
     "DefaultThemeProvider",
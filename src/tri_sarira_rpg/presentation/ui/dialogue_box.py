@@ -4,7 +4,13 @@ from __future__ import annotations
 
 import pygame
 
-from tri_sarira_rpg.presentation.theme import DialogueColors, FontCache, FontSizes, Spacing
+from tri_sarira_rpg.presentation.theme import (
+    DialogueColors,
+    FontCache,
+    FontSizes,
+    Spacing,
+    TextCache,
+)
 
 from .widgets import Widget
 
@@ -16,6 +22,7 @@ class DialogueBox(Widget):
         super().__init__(rect)
         self._lines: list[str] = []
         self._choices: list[tuple[str, str]] = []  # (choice_id, text)
+        self._choice_labels: list[str] = []  # "1. text", opgebouwd in set_content
         self._speaker: str = ""
         self._selected_choice_index: int = 0
 
@@ -26,6 +33,8 @@ class DialogueBox(Widget):
 
         # Colors (via DialogueColors scheme)
         self._colors = DialogueColors()
+        # Tekst blijft staan tot de volgende node; render elke regel maar één keer
+        self._text_cache = TextCache()
 
     def set_content(self, speaker: str, lines: list[str], choices: list[tuple[str, str]]) -> None:
         """Update tekst en keuzeopties.
@@ -42,6 +51,7 @@ class DialogueBox(Widget):
         self._speaker = speaker
         self._lines = lines
         self._choices = choices
+        self._choice_labels = [f"{i + 1}. {text}" for i, (_, text) in enumerate(choices)]
         self._selected_choice_index = 0  # Reset selection
 
     def handle_event(self, event: pygame.event.Event) -> str | None:
@@ -78,13 +88,8 @@ class DialogueBox(Widget):
 
     def draw(self, surface: pygame.Surface) -> None:
         """Render dialoogtekst en keuzes."""
-        # Create a surface with per-pixel alpha for transparency
-        box_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-
-        # Draw background with alpha
-        bg_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
-        pygame.draw.rect(box_surface, self._colors.bg, bg_rect)
-        pygame.draw.rect(box_surface, self._colors.border, bg_rect, 2)
+        # Background with alpha (allocated once, see Widget._get_panel)
+        box_surface = self._get_panel(self.rect.size, self._colors.bg, self._colors.border, 2)
 
         # Blit to main surface
         surface.blit(box_surface, self.rect.topleft)
@@ -92,13 +97,15 @@ class DialogueBox(Widget):
         # Draw speaker name
         y_offset = self.rect.top + Spacing.SM
         if self._speaker:
-            speaker_surf = self._font_speaker.render(self._speaker, True, self._colors.speaker)
+            speaker_surf = self._text_cache.render(
+                self._font_speaker, self._speaker, self._colors.speaker
+            )
             surface.blit(speaker_surf, (self.rect.left + Spacing.MD, y_offset))
             y_offset += Spacing.XXL
 
         # Draw dialogue lines
         for line in self._lines:
-            line_surf = self._font.render(line, True, self._colors.text)
+            line_surf = self._text_cache.render(self._font, line, self._colors.text)
             surface.blit(line_surf, (self.rect.left + Spacing.MD, y_offset))
             y_offset += Spacing.XL
 
@@ -107,7 +114,7 @@ class DialogueBox(Widget):
             y_offset += Spacing.MD
 
         # Draw choices
-        for i, (choice_id, text) in enumerate(self._choices):
+        for i, choice_text in enumerate(self._choice_labels):
             # Highlight selected choice
             color = (
                 self._colors.choice_selected
@@ -116,8 +123,7 @@ class DialogueBox(Widget):
             )
 
             # Draw choice number and text
-            choice_text = f"{i + 1}. {text}"
-            choice_surf = self._font.render(choice_text, True, color)
+            choice_surf = self._text_cache.render(self._font, choice_text, color)
             surface.blit(choice_surf, (self.rect.left + Spacing.XXL, y_offset))
             y_offset += Spacing.XL
 
@@ -217,8 +217,7 @@ class EquipmentMenuUI(Widget):
             Surface to render to
         """
         # Background
-        bg_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        bg_surface.fill(self._colors.bg)
+        bg_surface = self._get_panel(self.rect.size, self._colors.bg)
         surface.blit(bg_surface, self.rect.topleft)
 
         # Border
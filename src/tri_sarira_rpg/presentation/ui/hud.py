@@ -15,13 +15,18 @@ from tri_sarira_rpg.presentation.theme import (
     Colors,
     FontCache,
     FontSizes,
+    GlyphAtlas,
     Sizes,
     Spacing,
+    TextCache,
 )
 
 from .widgets import Widget
 
 
+# Printable ASCII voor de HUD glyph atlas
+_ATLAS_CHARSET = "".join(chr(code) for code in range(32, 127))
+
 # =============================================================================
 # View Models - typed dataclasses voor HUD data
 # =============================================================================
@@ -82,10 +87,24 @@ class HUD(Widget):
     def __init__(self, rect: pygame.Rect) -> None:
         super().__init__(rect)
         self._data: HUDData = HUDData()
+        # Geformatteerde tekstregels voor _data (zie update_stats)
+        self._party_text = f"Party (0/{self._data.party_max_size}):"
+        self._position_text = "Position: (0, 0)"
+        self._member_texts: list[str] = []
 
         # Fonts (via FontCache)
         self._font = FontCache.get(FontSizes.NORMAL)
         self._font_large = FontCache.get(FontSizes.XLARGE)
+        # Gerenderde tekst-surfaces; de meeste HUD-tekst is gelijk tussen frames
+        self._text_cache = TextCache()
+        # Tijd en positie wisselen bij elke stap: die worden glyph voor glyph
+        # uit een atlas geblit in plaats van als nieuwe string gerasterd
+        self._glyph_atlas = GlyphAtlas(self._font, Colors.TEXT_LIGHT, charset=_ATLAS_CHARSET)
+        # Statische controls-overlay (achtergrond + tekst), lazy opgebouwd
+        self._controls_overlay: pygame.Surface | None = None
+        # Eén feedback-achtergrond; de breedte volgt de tekst, dus alleen bij een
+        # andere size opnieuw gealloceerd (niet per size gecachet)
+        self._feedback_panel: pygame.Surface | None = None
 
     def update_stats(self, data: HUDData) -> None:
         """Ontvang data van scene en sla op voor rendering.
@@ -95,8 +114,18 @@ class HUD(Widget):
         data : HUDData
             Complete HUD state voor deze frame
         """
+        if data == self._data:
+            return
         self._data = data
 
+        # Tekstregels alleen opnieuw formatteren als de data veranderd is
+        self._party_text = f"Party ({len(data.party_members)}/{data.party_max_size}):"
+        self._position_text = f"Position: ({data.player_x}, {data.player_y})"
+        self._member_texts = [
+            f"  {member.name} Lv {member.level}" + (" (MC)" if member.is_main_character else "")
+            for member in data.party_members
+        ]
+
     def draw(self, surface: pygame.Surface) -> None:
         """Render de HUD elementen."""
         self._draw_top_bar(surface)
@@ -107,17 +136,17 @@ class HUD(Widget):
     def _draw_top_bar(self, surface: pygame.Surface) -> None:
         """Render de top bar met zone en tijd."""
         # Draw semi-transparent background
-        hud_bg = pygame.Surface((self._data.screen_width, Sizes.HUD_HEIGHT), pygame.SRCALPHA)
-        hud_bg.fill(Colors.BG_HUD)
+        hud_bg = self._get_panel((self._data.screen_width, Sizes.HUD_HEIGHT), Colors.BG_HUD)
         surface.blit(hud_bg, (0, 0))
 
         # Zone name
-        zone_text = self._font_large.render(self._data.zone_name, True, Colors.TEXT_WHITE)
+        zone_text = self._text_cache.render(
+            self._font_large, self._data.zone_name, Colors.TEXT_WHITE
+        )
         surface.blit(zone_text, (Spacing.LG, Spacing.MD))
 
         # Time display
-        time_text = self._font.render(self._data.time_display, True, Colors.TEXT_LIGHT)
-        surface.blit(time_text, (Spacing.LG, Spacing.XXXL))
+        self._blit_dynamic_text(surface, self._data.time_display, (Spacing.LG, Spacing.XXXL))
 
     def _draw_party_info(self, surface: pygame.Surface) -> None:
         """Render party info in top-right corner."""
@@ -127,38 +156,50 @@ class HUD(Widget):
         HEADER_LINE_HEIGHT = PARTY_LINE_HEIGHT
 
         # Party header
-        party_count = len(self._data.party_members)
-        party_text = f"Party ({party_count}/{self._data.party_max_size}):"
-        party_label = self._font.render(party_text, True, Colors.TEXT_LIGHT)
+        party_label = self._text_cache.render(self._font, self._party_text, Colors.TEXT_LIGHT)
         surface.blit(party_label, (HUD_RIGHT_X, HUD_PARTY_START_Y))
 
         # Position header
         position_y = HUD_PARTY_START_Y + HEADER_LINE_HEIGHT
-        pos_display = f"Position: ({self._data.player_x}, {self._data.player_y})"
-        pos_text = self._font.render(pos_display, True, Colors.TEXT_LIGHT)
-        surface.blit(pos_text, (HUD_RIGHT_X, position_y))
+        self._blit_dynamic_text(surface, self._position_text, (HUD_RIGHT_X, position_y))
 
         # Party members
         y_offset = position_y + HEADER_LINE_HEIGHT
-        for member in self._data.party_members:
-            member_text = f"  {member.name} Lv {member.level}"
-            if member.is_main_character:
-                member_text += " (MC)"
-
-            text = self._font.render(member_text, True, Colors.PARTY_LIGHT)
+        for member_text in self._member_texts:
+            text = self._text_cache.render(self._font, member_text, Colors.PARTY_LIGHT)
             surface.blit(text, (HUD_RIGHT_X, y_offset))
             y_offset += PARTY_LINE_HEIGHT
 
+    def _blit_dynamic_text(self, surface: pygame.Surface, text: str, pos: tuple[int, int]) -> None:
+        """Blit vaak wisselende TEXT_LIGHT tekst via de glyph atlas (TextCache als fallback)."""
+        if self._glyph_atlas.supports(text):
+            self._glyph_atlas.blit(surface, text, pos)
+        else:
+            surface.blit(self._text_cache.render(self._font, text, Colors.TEXT_LIGHT), pos)
+
     def _draw_controls_hint(self, surface: pygame.Surface) -> None:
         """Render controls hint in bottom-right corner."""
+        if self._controls_overlay is None:
+            self._controls_overlay = self._build_controls_overlay()
         controls_width, controls_height = Sizes.CONTROLS_BOX
-        controls_bg = pygame.Surface((controls_width, controls_height), pygame.SRCALPHA)
-        controls_bg.fill(Colors.BG_HUD)
         surface.blit(
-            controls_bg,
-            (self._data.screen_width - controls_width, self._data.screen_height - controls_height),
+            self._controls_overlay,
+            (
+                self._data.screen_width - controls_width,
+                self._data.screen_height - controls_height - Spacing.MD,
+            ),
         )
 
+    def _build_controls_overlay(self) -> pygame.Surface:
+        """Bak achtergrond + controls-tekst eenmalig in één overlay surface.
+
+        De eerste regel staat Spacing.MD boven het achtergrondvak, dus de
+        overlay is zo veel hoger en het vak begint op y = Spacing.MD.
+        """
+        controls_width, controls_height = Sizes.CONTROLS_BOX
+        overlay = pygame.Surface((controls_width, controls_height + Spacing.MD), pygame.SRCALPHA)
+        overlay.fill(Colors.BG_HUD, (0, Spacing.MD, controls_width, controls_height))
+
         controls_lines = [
             "Controls:",
             "Arrows: Move",
@@ -169,21 +210,19 @@ class HUD(Widget):
         ]
         for i, line in enumerate(controls_lines):
             text = self._font.render(line, True, Colors.TEXT_LIGHT)
-            surface.blit(
-                text,
-                (
-                    self._data.screen_width - controls_width + Spacing.SM,
-                    self._data.screen_height - controls_height - Spacing.MD + i * Spacing.LG,
-                ),
-            )
+            overlay.blit(text, (Spacing.SM, i * Spacing.LG))
+
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert_alpha()
+        return overlay
 
     def _draw_feedback(self, surface: pygame.Surface) -> None:
         """Render feedback message (save/load notifications)."""
         if not self._data.feedback_visible or not self._data.feedback_message:
             return
 
-        feedback_text = self._font_large.render(
-            self._data.feedback_message, True, Colors.HIGHLIGHT
+        feedback_text = self._text_cache.render(
+            self._font_large, self._data.feedback_message, Colors.HIGHLIGHT
         )
         text_rect = feedback_text.get_rect(
             center=(self._data.screen_width // 2, self._data.screen_height // 2 - 100)
@@ -197,8 +236,13 @@ class HUD(Widget):
             text_rect.width + 2 * padding,
             text_rect.height + 2 * padding,
         )
-        bg = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg.fill(Colors.BG_OVERLAY)
+        bg = self._feedback_panel
+        if bg is None or bg.get_size() != bg_rect.size:
+            bg = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+            bg.fill(Colors.BG_OVERLAY)
+            if pygame.display.get_surface() is not None:
+                bg = bg.convert_alpha()
+            self._feedback_panel = bg
         surface.blit(bg, bg_rect.topleft)
 
         # Draw text
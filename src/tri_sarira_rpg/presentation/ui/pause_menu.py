@@ -90,6 +90,8 @@ class PauseMenu(Widget):
 
         # Colors (via MenuColors scheme)
         self._colors = MenuColors()
+        # Overlay surface, hergebruikt tussen frames (elke render opnieuw gevuld)
+        self._overlay: pygame.Surface | None = None
 
         # Main menu options
         self._main_options = [
@@ -380,8 +382,10 @@ class PauseMenu(Widget):
         surface : pygame.Surface
             Surface to render on
         """
-        # Create semi-transparent background
-        overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        # Semi-transparent background; the surface is allocated once and refilled
+        overlay = self._overlay
+        if overlay is None or overlay.get_size() != self.rect.size:
+            overlay = self._overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
         overlay.fill(self._colors.bg)
 
         # Draw border
@@ -67,13 +67,8 @@ class QuestLogUI(Widget):
 
     def draw(self, surface: pygame.Surface) -> None:
         """Render quest log."""
-        # Create a surface with per-pixel alpha for transparency
-        log_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-
-        # Draw background with alpha
-        bg_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
-        pygame.draw.rect(log_surface, self._colors.bg, bg_rect)
-        pygame.draw.rect(log_surface, self._colors.border, bg_rect, 3)
+        # Background with alpha (allocated once, see Widget._get_panel)
+        log_surface = self._get_panel(self.rect.size, self._colors.bg, self._colors.border, 3)
 
         # Blit to main surface
         surface.blit(log_surface, self.rect.topleft)
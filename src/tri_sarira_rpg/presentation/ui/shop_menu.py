@@ -133,11 +133,8 @@ class ShopMenuUI(Widget):
 
     def draw(self, surface: pygame.Surface) -> None:
         """Render shop menu."""
-        # Create semi-transparent background
-        bg_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        bg_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
-        pygame.draw.rect(bg_surface, self._colors.bg, bg_rect)
-        pygame.draw.rect(bg_surface, self._colors.border, bg_rect, 3)
+        # Semi-transparent background (allocated once, see Widget._get_panel)
+        bg_surface = self._get_panel(self.rect.size, self._colors.bg, self._colors.border, 3)
         surface.blit(bg_surface, self.rect.topleft)
 
         # Title (shop name)
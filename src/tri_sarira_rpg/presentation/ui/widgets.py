@@ -10,6 +10,8 @@ class Widget:
 
     def __init__(self, rect: pygame.Rect) -> None:
         self.rect = rect
+        # Semi-transparante achtergronden per (size, color, border), zie _get_panel
+        self._panels: dict[tuple, pygame.Surface] = {}
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Ontvang input voor klik- of key-events."""
@@ -26,6 +28,26 @@ class Widget:
 
         pass
 
+    def _get_panel(
+        self,
+        size: tuple[int, int],
+        color: tuple,
+        border: tuple | None = None,
+        border_width: int = 0,
+    ) -> pygame.Surface:
+        """Geef een gevulde (semi-transparante) achtergrond, eenmalig gealloceerd per key."""
+        key = (size, color, border, border_width)
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = pygame.Surface(size, pygame.SRCALPHA)
+            panel.fill(color)
+            if border is not None and border_width > 0:
+                pygame.draw.rect(panel, border, panel.get_rect(), border_width)
+            if pygame.display.get_surface() is not None:
+                panel = panel.convert_alpha()
+            self._panels[key] = panel
+        return panel
+
 
 class Container(Widget):
     """Groepering van child-widgets."""
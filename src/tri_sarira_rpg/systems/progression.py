@@ -7,6 +7,7 @@ See: docs/architecture/3.5 Progression & Leveling Spec – Tri-Śarīra RPG.md
 from __future__ import annotations
 
 import logging
+import operator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -34,6 +35,26 @@ XP_CURVE_V0 = {
     10: 300,  # Lv 10 → Lv 11 (future)
 }
 
+# Display order for stat gains: (label, StatGains attribute).
+# Bit i of StatGains.positive_mask corresponds to entry i.
+STAT_GAIN_DISPLAY: tuple[tuple[str, str], ...] = (
+    ("HP", "max_hp"),
+    ("STR", "STR"),
+    ("END", "END"),
+    ("DEF", "DEF"),
+    ("SPD", "SPD"),
+    ("ACC", "ACC"),
+    ("FOC", "FOC"),
+    ("INS", "INS"),
+    ("WILL", "WILL"),
+    ("MAG", "MAG"),
+    ("PRA", "PRA"),
+    ("RES", "RES"),
+)
+
+# Reads the STAT_GAIN_DISPLAY attributes of a StatGains in one call (see display_values)
+_DISPLAY_VALUES_GETTER = operator.attrgetter(*(attr for _, attr in STAT_GAIN_DISPLAY))
+
 
 @dataclass
 class GrowthWeights:
@@ -77,25 +98,30 @@ class StatGains:
     max_focus: int = 0
     max_prana: int = 0
 
+    @property
+    def display_values(self) -> tuple[int, ...]:
+        """Gain values as one flat tuple, in STAT_GAIN_DISPLAY order."""
+        return _DISPLAY_VALUES_GETTER(self)
+
+    @property
+    def positive_mask(self) -> int:
+        """Bitmask of displayed stats with a positive gain (see STAT_GAIN_DISPLAY).
+
+        Zero means there is nothing to show, so callers can skip formatting entirely.
+        """
+        mask = 0
+        for bit, value in enumerate(self.display_values):
+            if value > 0:
+                mask |= 1 << bit
+        return mask
+
     def __str__(self) -> str:
         """Format stat gains for display."""
-        parts = []
-        for stat, value in [
-            ("HP", self.max_hp),
-            ("STR", self.STR),
-            ("END", self.END),
-            ("DEF", self.DEF),
-            ("SPD", self.SPD),
-            ("ACC", self.ACC),
-            ("FOC", self.FOC),
-            ("INS", self.INS),
-            ("WILL", self.WILL),
-            ("MAG", self.MAG),
-            ("PRA", self.PRA),
-            ("RES", self.RES),
-        ]:
-            if value > 0:
-                parts.append(f"{stat} +{value}")
+        parts = [
+            f"{stat} +{value}"
+            for (stat, _), value in zip(STAT_GAIN_DISPLAY, self.display_values, strict=True)
+            if value > 0
+        ]
         return ", ".join(parts) if parts else "no gains"
 
 
@@ -333,4 +359,11 @@ class ProgressionSystem:
         return (new_level, new_xp, level_ups)
 
 
-__all__ = ["ProgressionSystem", "GrowthWeights", "StatGains", "LevelUpResult", "XP_CURVE_V0"]
+__all__ = [
+    "ProgressionSystem",
+    "GrowthWeights",
+    "StatGains",
+    "LevelUpResult",
+    "XP_CURVE_V0",
+    "STAT_GAIN_DISPLAY",
+]
@@ -25,7 +25,7 @@ from tri_sarira_rpg.utils.tiled_loader import TiledLoader, TiledMap
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """Speler positie en state in de wereld."""
 
@@ -576,34 +576,23 @@ class WorldSystem:
         if not self._player or not self._current_map:
             return
 
-        portals = self._current_map.get_portals()
-        player_x, player_y = self._player.position.x, self._player.position.y
+        # Alleen portals op de tile van de speler (multi-tile portals zitten in de index)
+        portals = self._current_map.get_portals_at(self._player.position.x, self._player.position.y)
 
         for portal in portals:
-            portal_x, portal_y = portal.get_tile_coords(self._current_map.tile_width)
-
-            # Check if player is on portal (we support multi-tile portals)
-            portal_width_tiles = max(1, portal.width // self._current_map.tile_width)
-            portal_height_tiles = max(1, portal.height // self._current_map.tile_height)
-
-            if (
-                portal_x <= player_x < portal_x + portal_width_tiles
-                and portal_y <= player_y < portal_y + portal_height_tiles
-            ):
-                # Portal found!
-                target_zone_id = portal.properties.get("target_zone_id")
-                target_spawn_id = portal.properties.get("target_spawn_id")
-
-                if target_zone_id:
-                    logger.info(
-                        f"Portal transition: {self._current_zone_id} → {target_zone_id} "
-                        f"(spawn: {target_spawn_id or 'default'})"
-                    )
-                    current_facing = self._player.facing if self._player else None
-                    self.load_zone(
-                        target_zone_id, target_spawn_id, from_portal=True, facing=current_facing
-                    )
-                    return
+            target_zone_id = portal.properties.get("target_zone_id")
+            target_spawn_id = portal.properties.get("target_spawn_id")
+
+            if target_zone_id:
+                logger.info(
+                    f"Portal transition: {self._current_zone_id} → {target_zone_id} "
+                    f"(spawn: {target_spawn_id or 'default'})"
+                )
+                current_facing = self._player.facing if self._player else None
+                self.load_zone(
+                    target_zone_id, target_spawn_id, from_portal=True, facing=current_facing
+                )
+                return
 
     @property
     def current_zone_id(self) -> str | None:
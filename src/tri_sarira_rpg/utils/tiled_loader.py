@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -75,6 +76,18 @@ class TiledMap:
         tile_gid = collision_layer.data[tile_y][tile_x]
         return tile_gid != 0  # Any tile = blocking
 
+    @cached_property
+    def collision_grid(self) -> tuple[tuple[bool, ...], ...]:
+        """Collision per tile als grid: collision_grid[y][x] (True = blocked).
+
+        Eén keer per map opgebouwd, zodat renderloops een rij kunnen indexeren
+        in plaats van get_collision_at per tile aan te roepen.
+        """
+        return tuple(
+            tuple(self.get_collision_at(x, y) for x in range(self.width))
+            for y in range(self.height)
+        )
+
     def get_spawns(self) -> list[TiledObject]:
         """Haal alle PlayerSpawn objecten op."""
         if "Spawns" not in self.object_layers:
@@ -104,6 +117,27 @@ class TiledMap:
             return []
         return [obj for obj in self.object_layers["Portals"].objects if obj.type == "Portal"]
 
+    @cached_property
+    def _portal_cells(self) -> dict[tuple[int, int], list[TiledObject]]:
+        """Ruimtelijke index: tile (x, y) → portals die die tile bedekken.
+
+        Eén keer per map opgebouwd (maps veranderen niet na het laden).
+        Multi-tile portals staan in al hun cellen, in layer-volgorde.
+        """
+        cells: dict[tuple[int, int], list[TiledObject]] = {}
+        for portal in self.get_portals():
+            portal_x, portal_y = portal.get_tile_coords(self.tile_width)
+            width_tiles = max(1, portal.width // self.tile_width)
+            height_tiles = max(1, portal.height // self.tile_height)
+            for y in range(portal_y, portal_y + height_tiles):
+                for x in range(portal_x, portal_x + width_tiles):
+                    cells.setdefault((x, y), []).append(portal)
+        return cells
+
+    def get_portals_at(self, tile_x: int, tile_y: int) -> list[TiledObject]:
+        """Haal de portals op die een tile bedekken (via de cel-index)."""
+        return self._portal_cells.get((tile_x, tile_y), [])
+
     def get_chests(self) -> list[TiledObject]:
         """Haal alle Chest objecten op."""
         if "Chests" not in self.object_layers:
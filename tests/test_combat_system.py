@@ -12,6 +12,7 @@ from tri_sarira_rpg.systems.combat import (
     CombatSystem,
 )
 from tri_sarira_rpg.systems.party import PartySystem
+from tri_sarira_rpg.systems.progression import STAT_GAIN_DISPLAY, StatGains
 from tri_sarira_rpg.systems.time import TimeSystem
 
 
@@ -472,3 +473,14 @@ def test_battle_ongoing(combat_system: CombatSystem) -> None:
     # Both party and enemies alive
     outcome = combat_system.check_battle_end()
     assert outcome == BattleOutcome.ONGOING
+
+
+def test_stat_gains_positive_mask() -> None:
+    """positive_mask has one bit per displayed stat with a positive gain."""
+    assert StatGains().positive_mask == 0
+
+    gains = StatGains(max_hp=5, WILL=1, RES=0)
+    labels = [label for label, _ in STAT_GAIN_DISPLAY]
+    assert gains.positive_mask == (1 << labels.index("HP")) | (1 << labels.index("WILL"))
+    assert gains.display_values[labels.index("WILL")] == 1
+    assert str(gains) == "HP +5, WILL +1"
@@ -199,6 +199,35 @@ class TestSceneStackManager:
 
         manager.render(MagicMock())  # Mag geen exception geven
 
+    def test_needs_render_for_dirty_scene(self) -> None:
+        """Standaard is een scene altijd dirty en wordt elk frame getekend."""
+        manager = SceneStackManager()
+        manager.push_scene(DummyScene(manager))
+
+        manager.render(MagicMock())
+
+        assert manager.needs_render() is True
+
+    def test_needs_render_skips_static_scene_until_switch(self) -> None:
+        """Een niet-dirty scene hoeft pas opnieuw na een scenewissel."""
+        manager = SceneStackManager()
+        static = DummyScene(manager, "static")
+        static.is_dirty = lambda: False  # type: ignore[method-assign]
+        manager.push_scene(static)
+
+        assert manager.needs_render() is True  # Nog nooit getekend
+        manager.render(MagicMock())
+        assert manager.needs_render() is False
+
+        manager.push_scene(DummyScene(manager, "overlay"))
+        manager.render(MagicMock())
+        manager.pop_scene()
+        assert manager.needs_render() is True  # Scherm toont nog de overlay
+
+    def test_needs_render_empty_stack(self) -> None:
+        """Lege stack heeft niets te tekenen."""
+        assert SceneStackManager().needs_render() is False
+
 
 # =============================================================================
 # Protocol Compliance Tests
@@ -0,0 +1,69 @@
+"""Tests voor TextCache (gecachte tekst-surfaces)."""
+
+from __future__ import annotations
+
+from tri_sarira_rpg.presentation.theme import TextCache
+
+
+class FakeFont:
+    """Minimale font-stub die render-aanroepen telt."""
+
+    def __init__(self) -> None:
+        self.render_calls: list[tuple[str, bool, tuple]] = []
+
+    def render(self, text: str, antialias: bool, color: tuple) -> object:
+        self.render_calls.append((text, antialias, color))
+        return object()
+
+
+def test_render_hits_cache_for_same_key() -> None:
+    """Zelfde (font, text, color) rendert maar één keer."""
+    cache = TextCache()
+    font = FakeFont()
+
+    first = cache.render(font, "HP: 10/20", (255, 255, 255))
+    second = cache.render(font, "HP: 10/20", (255, 255, 255))
+
+    assert first is second
+    assert font.render_calls == [("HP: 10/20", True, (255, 255, 255))]
+
+
+def test_render_misses_on_different_color_or_font() -> None:
+    """Andere kleur of font geeft een eigen entry."""
+    cache = TextCache()
+    font_a = FakeFont()
+    font_b = FakeFont()
+
+    cache.render(font_a, "Attack", (1, 1, 1))
+    cache.render(font_a, "Attack", (2, 2, 2))
+    cache.render(font_b, "Attack", (1, 1, 1))
+
+    assert len(cache) == 3
+    assert len(font_a.render_calls) == 2
+    assert len(font_b.render_calls) == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Bij maxsize valt de minst recent gebruikte entry eruit."""
+    cache = TextCache(maxsize=2)
+    font = FakeFont()
+
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    cache.render(font, "a", (0, 0, 0))  # "a" wordt recent gebruikt
+    cache.render(font, "c", (0, 0, 0))  # "b" valt eruit
+
+    assert len(cache) == 2
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    assert [call[0] for call in font.render_calls] == ["a", "b", "c", "b"]
+
+
+def test_clear_empties_cache() -> None:
+    """clear() verwijdert alle entries."""
+    cache = TextCache()
+    cache.render(FakeFont(), "x", (0, 0, 0))
+
+    cache.clear()
+
+    assert len(cache) == 0
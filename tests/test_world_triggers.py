@@ -9,7 +9,7 @@ from tri_sarira_rpg.core.entities import Position
 from tri_sarira_rpg.data_access.repository import DataRepository
 from tri_sarira_rpg.systems.world import Trigger, WorldSystem
 from tri_sarira_rpg.systems.time import TimeSystem
-from tri_sarira_rpg.utils.tiled_loader import ObjectLayer, TiledMap, TiledObject
+from tri_sarira_rpg.utils.tiled_loader import ObjectLayer, TiledMap, TiledObject, TileLayer
 
 
 class DummyFlags:
@@ -169,6 +169,34 @@ def test_time_advances_on_move() -> None:
     assert time_system.state.time_of_day == start_time + 1
 
 
+def test_collision_grid_matches_get_collision_at() -> None:
+    """collision_grid moet per tile gelijk zijn aan get_collision_at, ook buiten de layer."""
+    tiled_map = TiledMap(width=3, height=3, tile_width=32, tile_height=32)
+    tiled_map.tile_layers["Collision"] = TileLayer(
+        name="Collision", width=2, height=3, data=[[0, 1], [0, 0], [5, 0]]
+    )
+
+    grid = tiled_map.collision_grid
+
+    assert len(grid) == 3
+    for y in range(3):
+        assert grid[y] == tuple(tiled_map.get_collision_at(x, y) for x in range(3))
+    assert grid[0] == (False, True, True)
+
+
+def test_get_portals_at_covers_multi_tile_portals() -> None:
+    """get_portals_at moet elke tile van een multi-tile portal vinden, en niets ernaast."""
+    tiled_map = TiledMap(width=10, height=10, tile_width=32, tile_height=32)
+    wide = TiledObject(id=1, name="p_wide", type="Portal", x=64, y=96, width=96, height=32)
+    single = TiledObject(id=2, name="p_single", type="Portal", x=0, y=0)
+    tiled_map.object_layers["Portals"] = ObjectLayer(name="Portals", objects=[wide, single])
+
+    assert [tiled_map.get_portals_at(x, 3) for x in (2, 3, 4)] == [[wide]] * 3
+    assert tiled_map.get_portals_at(5, 3) == []
+    assert tiled_map.get_portals_at(2, 4) == []
+    assert tiled_map.get_portals_at(0, 0) == [single]
+
+
 def test_time_advances_on_portal_transition(monkeypatch) -> None:
     """Portal/zone wissel moet 1 minuut toevoegen bovenop de stap."""
     time_system = TimeSystem()